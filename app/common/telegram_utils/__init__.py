@@ -5,7 +5,7 @@ from .keyboard_factory import (
     create_confirmation_keyboard,
     create_multiple_choice_keyboard,
 )
-from .message_sender import safe_send_markdown, safe_edit_markdown
+from .message_sender import safe_send_markdown, safe_edit_markdown, StreamingReply
 
 __all__ = [
     "create_edit_delete_keyboard",
@@ -13,4 +13,5 @@ __all__ = [
     "create_multiple_choice_keyboard",
     "safe_send_markdown",
     "safe_edit_markdown",
+    "StreamingReply",
 ]
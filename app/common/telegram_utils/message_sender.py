@@ -1,7 +1,8 @@
 """Safe message sending utilities for Telegram bot."""
 
 import logging
-from typing import Optional, Union
+import time
+from typing import List, Optional, Union
 from telegram import Update, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
@@ -98,6 +99,62 @@ async def safe_edit_markdown(
         return False
 
 
+class StreamingReply:
+    """Reply to a message with text that is still being generated.
+
+    Tokens are collected and shown in a single plain-text draft message that
+    is edited as more text arrives, at most once per edit_interval seconds
+    since Telegram rate-limits edits. reset() starts the draft over for a new
+    reply. finish() puts the final Markdown text in place of the draft, or
+    sends it as a normal reply if no draft was shown.
+    """
+
+    def __init__(self, message, edit_interval: float = 1.0):
+        self.message = message
+        self.edit_interval = edit_interval
+        self._tokens: List[str] = []
+        self._draft = None
+        self._last_update = 0.0
+
+    async def add(self, token: str) -> None:
+        """Add a generated token and refresh the draft if it is due."""
+        self._tokens.append(token)
+
+        now = time.monotonic()
+        if now - self._last_update < self.edit_interval:
+            return
+
+        text = "".join(self._tokens).strip()
+        if not text:
+            return
+
+        self._last_update = now
+        try:
+            if self._draft is None:
+                self._draft = await self.message.reply_text(text)
+            else:
+                await self._draft.edit_text(text)
+        except Exception as e:
+            logger.warning(f"Failed to update streamed reply: {e}")
+
+    async def reset(self) -> None:
+        """Drop the tokens collected so far, so the draft shows a new reply."""
+        self._tokens.clear()
+
+    async def finish(self, text: str) -> None:
+        """Show the final text, replacing the draft if one was sent and can be edited."""
+        # The edit can fail, e.g. on flood control after the draft edits or
+        # if the draft was deleted; the full text is then sent as a new reply
+        if self._draft is not None and await safe_edit_markdown(self._draft, text):
+            return
+
+        # Try markdown first, fallback to plain text
+        try:
+            await self.message.reply_text(text, parse_mode="Markdown")
+        except Exception:
+            await self.message.reply_text(text)
+
+
 def _strip_markdown(text: str) -> str:
     """Remove markdown formatting from text.
 
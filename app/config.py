@@ -21,6 +21,12 @@ class Settings(BaseSettings):
     token: str = os.getenv("TELEGRAM_BOT_TOKEN")
     openai_api_key: str = os.getenv("OPENAI_API_KEY")
     llm_model: str = os.getenv("LLM_MODEL", "gpt-4o")
+    # Cheaper model the chatbot uses to phrase its reply to tool results
+    fast_llm_model: str = os.getenv("FAST_LLM_MODEL", "gpt-4o-mini")
+    # Words analyzed in parallel by a bulk text processing job
+    bulk_concurrency: int = int(os.getenv("BULK_CONCURRENCY", "3"))
+    # Telegram updates processed at once, across different users
+    update_concurrency: int = int(os.getenv("UPDATE_CONCURRENCY", "32"))
 
     # MongoDB settings
     mongodb_cluster: str = os.getenv("MONGODB_CLUSTER")
@@ -1,7 +1,11 @@
 import logging
 from typing import List, Dict, Optional
 from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from pymongo.errors import (
+    BulkWriteError,
+    ConnectionFailure,
+    ServerSelectionTimeoutError,
+)
 from bson import ObjectId
 from datetime import datetime, timedelta
 
@@ -20,6 +24,21 @@ from app.flashcards.models import (
 logger = logging.getLogger(__name__)
 
 
+def _due_by(deadline: datetime) -> Dict:
+    """Aggregation condition for a card due by the deadline.
+
+    Aggregation sorts missing and null values before every date, so they are
+    excluded explicitly; like a {"due_date": {"$lte": deadline}} query, only
+    cards with a due date can be due.
+    """
+    return {
+        "$and": [
+            {"$eq": [{"$type": "$due_date"}, "date"]},
+            {"$lte": ["$due_date", deadline]},
+        ]
+    }
+
+
 class FlashcardDatabaseV2:
     """Enhanced database service for the new flashcard system."""
 
@@ -91,6 +110,40 @@ class FlashcardDatabaseV2:
             logger.error(f"Error adding flashcard: {e}")
             return None
 
+    def add_flashcards_bulk(
+        self, flashcards: List[FlashcardUnion]
+    ) -> List[Optional[str]]:
+        """Add several flashcards in one round trip.
+
+        Returns the new IDs in input order, with None for cards that failed.
+        """
+        if not flashcards:
+            return []
+
+        flashcard_dicts = []
+        for flashcard in flashcards:
+            flashcard_dict = flashcard.model_dump()
+            if flashcard_dict.get("id") is None:
+                flashcard_dict.pop("id", None)
+            flashcard_dicts.append(flashcard_dict)
+
+        failed_indexes = set()
+        try:
+            # Unordered, so one bad card does not stop the rest
+            self.collection.insert_many(flashcard_dicts, ordered=False)
+        except BulkWriteError as e:
+            failed_indexes = {error["index"] for error in e.details["writeErrors"]}
+            logger.error(f"Failed to add {len(failed_indexes)} flashcards: {e}")
+        except Exception as e:
+            logger.error(f"Error adding flashcards: {e}")
+            return [None] * len(flashcards)
+
+        # insert_many sets _id on each document before sending it
+        return [
+            None if index in failed_indexes else str(flashcard_dict["_id"])
+            for index, flashcard_dict in enumerate(flashcard_dicts)
+        ]
+
     def get_flashcards(
         self,
         user_id: int,
@@ -289,6 +342,74 @@ class FlashcardDatabaseV2:
             logger.error(f"Error retrieving tags: {e}")
             return []
 
+    def get_stats_bundle(self, user_id: int) -> Dict[str, int]:
+        """Get per-type and due counts for a user's flashcards in a single aggregation."""
+        try:
+            now = datetime.now()
+            pipeline = [
+                {"$match": {"user_id": user_id}},
+                {
+                    "$group": {
+                        "_id": None,
+                        "total": {"$sum": 1},
+                        "two_sided": {
+                            "$sum": {
+                                "$cond": [
+                                    {"$eq": ["$type", FlashcardType.TWO_SIDED.value]},
+                                    1,
+                                    0,
+                                ]
+                            }
+                        },
+                        "fill_in_blank": {
+                            "$sum": {
+                                "$cond": [
+                                    {"$eq": ["$type", FlashcardType.FILL_IN_BLANK.value]},
+                                    1,
+                                    0,
+                                ]
+                            }
+                        },
+                        "multiple_choice": {
+                            "$sum": {
+                                "$cond": [
+                                    {"$eq": ["$type", FlashcardType.MULTIPLE_CHOICE.value]},
+                                    1,
+                                    0,
+                                ]
+                            }
+                        },
+                        "due_for_review": {
+                            "$sum": {"$cond": [_due_by(now), 1, 0]}
+                        },
+                    }
+                },
+            ]
+
+            result = list(self.collection.aggregate(pipeline))
+            stats = result[0] if result else {}
+
+            return {
+                key: stats.get(key, 0)
+                for key in (
+                    "total",
+                    "two_sided",
+                    "fill_in_blank",
+                    "multiple_choice",
+                    "due_for_review",
+                )
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting flashcard stats bundle: {e}")
+            return {
+                "total": 0,
+                "two_sided": 0,
+                "fill_in_blank": 0,
+                "multiple_choice": 0,
+                "due_for_review": 0,
+            }
+
     def get_dashboard_stats(self, user_id: int) -> Dict[str, int]:
         """Get dashboard statistics for flashcards."""
         try:
@@ -296,33 +417,47 @@ class FlashcardDatabaseV2:
             today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
             week_end = now + timedelta(days=7)
 
-            # Total flashcards
-            total_count = self.get_flashcard_count(user_id)
-
-            # Due today
-            due_today = self.collection.count_documents(
-                {"user_id": user_id, "due_date": {"$lte": today_end}}
-            )
-
-            # Due this week
-            due_this_week = self.collection.count_documents(
-                {"user_id": user_id, "due_date": {"$lte": week_end}}
-            )
-
-            # New flashcards (never reviewed)
-            new_cards = self.collection.count_documents({"user_id": user_id, "times_reviewed": 0})
+            pipeline = [
+                {"$match": {"user_id": user_id}},
+                {
+                    "$group": {
+                        "_id": None,
+                        "total": {"$sum": 1},
+                        "due_today": {
+                            "$sum": {"$cond": [_due_by(today_end), 1, 0]}
+                        },
+                        "due_this_week": {
+                            "$sum": {"$cond": [_due_by(week_end), 1, 0]}
+                        },
+                        # New flashcards (never reviewed)
+                        "new": {
+                            "$sum": {"$cond": [{"$eq": ["$times_reviewed", 0]}, 1, 0]}
+                        },
+                        # Mastered flashcards (high ease factor and long intervals)
+                        "mastered": {
+                            "$sum": {
+                                "$cond": [
+                                    {
+                                        "$and": [
+                                            {"$gte": ["$ease_factor", 2.5]},
+                                            {"$gte": ["$interval_days", 30]},
+                                        ]
+                                    },
+                                    1,
+                                    0,
+                                ]
+                            }
+                        },
+                    }
+                },
+            ]
 
-            # Mastered flashcards (high ease factor and long intervals)
-            mastered_cards = self.collection.count_documents(
-                {"user_id": user_id, "ease_factor": {"$gte": 2.5}, "interval_days": {"$gte": 30}}
-            )
+            result = list(self.collection.aggregate(pipeline))
+            stats = result[0] if result else {}
 
             return {
-                "total": total_count,
-                "due_today": due_today,
-                "due_this_week": due_this_week,
-                "new": new_cards,
-                "mastered": mastered_cards,
+                key: stats.get(key, 0)
+                for key in ("total", "due_today", "due_this_week", "new", "mastered")
             }
 
         except Exception as e:
@@ -444,7 +579,7 @@ class FlashcardDatabaseV2:
             if doc:
                 doc["id"] = str(doc["_id"])
                 del doc["_id"]
-                return DictionaryWord(**doc)
+                return DictionaryWord.model_validate(doc)
 
             return None
 
@@ -507,7 +642,7 @@ class FlashcardDatabaseV2:
                 try:
                     doc["id"] = str(doc["_id"])
                     del doc["_id"]
-                    words.append(DictionaryWord(**doc))
+                    words.append(DictionaryWord.model_validate(doc))
                 except Exception as e:
                     logger.warning(f"Failed to parse processed word document: {e}")
                     continue
@@ -1,6 +1,7 @@
 """Question formatting for Telegram bot display."""
 
 import logging
+from functools import lru_cache
 from typing import Tuple, Optional, Any
 from app.flashcards.models import (
     FlashcardUnion,
@@ -14,6 +15,16 @@ from .keyboard_builder import KeyboardBuilder
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _escape_question(question: str) -> str:
+    """Escape a question for Telegram markdown, once per distinct text.
+
+    Keyed by the text itself, so an edited or copied card never gets a
+    stale rendering.
+    """
+    return escape_markdown(question)
+
+
 class QuestionFormatter:
     """Formats flashcard questions for display in the Telegram bot."""
 
@@ -54,10 +65,8 @@ class QuestionFormatter:
         self, flashcard: FillInTheBlank
     ) -> Tuple[str, Optional[Any]]:
         """Format a fill-in-the-blank flashcard."""
-        question = flashcard.get_question()
-
-        # Escape markdown special characters in the question
-        escaped_question = escape_markdown(question)
+        # Question text with markdown special characters escaped
+        escaped_question = _escape_question(flashcard.get_question())
 
         # Get the grammatical form hint from metadata
         form_hint = "the missing ending"
@@ -164,11 +164,11 @@ def create_flashcard_from_dict(data: dict) -> FlashcardUnion:
     flashcard_type = data.get("type")
 
     if flashcard_type == FlashcardType.TWO_SIDED:
-        return TwoSidedCard(**data)
+        return TwoSidedCard.model_validate(data)
     elif flashcard_type == FlashcardType.FILL_IN_BLANK:
-        return FillInTheBlank(**data)
+        return FillInTheBlank.model_validate(data)
     elif flashcard_type == FlashcardType.MULTIPLE_CHOICE:
-        return MultipleChoice(**data)
+        return MultipleChoice.model_validate(data)
     else:
         raise ValueError(f"Unknown flashcard type: {flashcard_type}")
 
@@ -4,7 +4,7 @@ import logging
 import random
 from typing import List, Optional, Tuple, Dict, Any
 
-from app.flashcards.models import FlashcardUnion, FlashcardType
+from app.flashcards.models import FlashcardUnion
 from app.flashcards.database import flashcard_db_v2
 from app.flashcards.validators import AnswerValidator
 from app.flashcards.formatters import QuestionFormatter
@@ -98,24 +98,11 @@ class FlashcardService:
     def get_flashcard_stats(self, user_id: int) -> Dict[str, Any]:
         """Get statistics about the flashcard collection."""
         try:
-            total_count = self.db.get_flashcard_count(user_id)
-            two_sided_count = self.db.get_flashcard_count(user_id, FlashcardType.TWO_SIDED)
-            fill_blank_count = self.db.get_flashcard_count(user_id, FlashcardType.FILL_IN_BLANK)
-            multiple_choice_count = self.db.get_flashcard_count(
-                user_id, FlashcardType.MULTIPLE_CHOICE
-            )
-
-            due_count = len(
-                self.db.get_due_flashcards(user_id=user_id, limit=1000)
-            )  # Get a large number to count
+            stats = self.db.get_stats_bundle(user_id)
             tags = self.db.get_tags(user_id)
 
             return {
-                "total": total_count,
-                "two_sided": two_sided_count,
-                "fill_in_blank": fill_blank_count,
-                "multiple_choice": multiple_choice_count,
-                "due_for_review": due_count,
+                **stats,
                 "unique_tags": len(tags),
                 "tags": tags[:10],  # Show first 10 tags
             }
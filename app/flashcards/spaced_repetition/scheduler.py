@@ -95,31 +95,40 @@ class ReviewScheduler:
             if not flashcards:
                 return stats
 
+            # A card is overdue once it is at least one full day past due
+            overdue_cutoff = now - timedelta(days=1)
+            due_now = overdue = new = difficult = 0
             ease_sum = 0.0
             difficulty_counts = {}
 
             for card in flashcards:
                 # Count due and overdue cards
-                if card.due_date <= now:
-                    stats["due_now"] += 1
-                    if (now - card.due_date).days > 0:
-                        stats["overdue"] += 1
+                due_date = card.due_date
+                if due_date <= now:
+                    due_now += 1
+                    if due_date <= overdue_cutoff:
+                        overdue += 1
 
                 # Count new cards
                 if card.repetition_count == 0:
-                    stats["new"] += 1
+                    new += 1
 
                 # Count difficult cards
-                if card.ease_factor < 2.0 or card.times_incorrect > card.times_correct:
-                    stats["difficult"] += 1
+                ease_factor = card.ease_factor
+                if ease_factor < 2.0 or card.times_incorrect > card.times_correct:
+                    difficult += 1
 
                 # Accumulate ease factor
-                ease_sum += card.ease_factor
+                ease_sum += ease_factor
 
                 # Count difficulty distribution
                 difficulty = card.difficulty.value
                 difficulty_counts[difficulty] = difficulty_counts.get(difficulty, 0) + 1
 
+            stats["due_now"] = due_now
+            stats["overdue"] = overdue
+            stats["new"] = new
+            stats["difficult"] = difficult
             stats["average_ease"] = ease_sum / len(flashcards)
             stats["difficulty_distribution"] = difficulty_counts
 
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Literal, Dict, Optional
+from pydantic import BaseModel, ConfigDict
+from typing import Literal, Dict, Optional, Final, ClassVar
+from typing_extensions import TypeAliasType
 
 Case = Literal["nom", "gen", "dat", "acc", "ins", "pre"]
 Gender = Literal["masculine", "feminine", "neuter"]
@@ -8,80 +9,219 @@ WordType = Literal[
 ]
 Aspect = Literal["perfective", "imperfective", "both"]
 Person = Literal["first", "second", "third"]
-Number = Literal["singular", "plural"]
+GrammaticalNumber = Literal["singular", "plural"]
 Tense = Literal["present", "past", "future"]
 Mood = Literal["indicative", "imperative", "conditional"]
 
+# Named alias so pydantic builds one shared validator for every case-forms field
+CaseForms = TypeAliasType("CaseForms", Dict[Case, str])
+
+
+_CASE_FORMS_SCHEMA_TEMPLATE: Final[str] = (
+    '  "{field}": {{\n'
+    '    "nom": "string",\n'
+    '    "gen": "string",\n'
+    '    "dat": "string",\n'
+    '    "acc": "string",\n'
+    '    "ins": "string",\n'
+    '    "pre": "string"\n'
+    "  }}"
+)
+
+
+def _case_forms_schema(field: str, nullable: bool = False) -> str:
+    """Format-instructions snippet for a field holding all six case forms."""
+    schema = _CASE_FORMS_SCHEMA_TEMPLATE.format(field=field)
+    return f"{schema} | null" if nullable else schema
+
+
+_WORD_CLASSIFICATION_FORMAT_INSTRUCTIONS: Final[str] = (
+    "Your response must be valid JSON that matches this schema:\n"
+    "{\n"
+    '  "word_type": "noun" | "verb" | "adjective" | "adverb" | "preposition" | "number" | "pronoun",\n'
+    '  "russian_word": "string (the Russian translation/form of the word)",\n'
+    '  "original_word": "string (the original input word)"\n'
+    "}"
+)
+
+_NOUN_FORMAT_INSTRUCTIONS: Final[str] = (
+    "Your response must be valid JSON that matches this schema:\n"
+    "{\n"
+    '  "dictionary_form": "string (base form of the noun)",\n'
+    '  "gender": "masculine" | "feminine" | "neuter",\n'
+    '  "animacy": true | false,\n'
+    + _case_forms_schema("singular")
+    + ",\n"
+    + _case_forms_schema("plural")
+    + ",\n"
+    '  "english_translation": "string"\n'
+    "}"
+)
+
+_ADJECTIVE_FORMAT_INSTRUCTIONS: Final[str] = (
+    "Your response must be valid JSON that matches this schema:\n"
+    "{\n"
+    '  "dictionary_form": "string (base form of the adjective)",\n'
+    '  "english_translation": "string",\n'
+    + _case_forms_schema("masculine")
+    + ",\n"
+    + _case_forms_schema("feminine")
+    + ",\n"
+    + _case_forms_schema("neuter")
+    + ",\n"
+    + _case_forms_schema("plural")
+    + ",\n"
+    '  "short_form_masculine": "string (optional)",\n'
+    '  "short_form_feminine": "string (optional)",\n'
+    '  "short_form_neuter": "string (optional)",\n'
+    '  "short_form_plural": "string (optional)",\n'
+    '  "comparative": "string (optional)",\n'
+    '  "superlative": "string (optional)"\n'
+    "}"
+)
+
+_VERB_FORMAT_INSTRUCTIONS: Final[str] = (
+    "Your response must be valid JSON that matches this schema:\n"
+    "{\n"
+    '  "dictionary_form": "string (infinitive form of the verb)",\n'
+    '  "english_translation": "string",\n'
+    '  "aspect": "perfective" | "imperfective" | "both",\n'
+    '  "aspect_pair": "string or null (the aspectual partner verb if it exists)",\n'
+    '  "directionality": "unidirectional" | "multidirectional" | "both" | "none",\n'
+    '  "present_first_singular": "string or null (я form, only for imperfective verbs)",\n'
+    '  "present_second_singular": "string or null (ты form, only for imperfective verbs)",\n'
+    '  "present_third_singular": "string or null (он/она/оно form, only for imperfective verbs)",\n'
+    '  "present_first_plural": "string or null (мы form, only for imperfective verbs)",\n'
+    '  "present_second_plural": "string or null (вы form, only for imperfective verbs)",\n'
+    '  "present_third_plural": "string or null (они form, only for imperfective verbs)",\n'
+    '  "past_masculine": "string (он form)",\n'
+    '  "past_feminine": "string (она form)",\n'
+    '  "past_neuter": "string (оно form)",\n'
+    '  "past_plural": "string (они form)",\n'
+    '  "future_first_singular": "string or null (я form, for perfective or compound future)",\n'
+    '  "future_second_singular": "string or null (ты form, for perfective or compound future)",\n'
+    '  "future_third_singular": "string or null (он/она/оно form, for perfective or compound future)",\n'
+    '  "future_first_plural": "string or null (мы form, for perfective or compound future)",\n'
+    '  "future_second_plural": "string or null (вы form, for perfective or compound future)",\n'
+    '  "future_third_plural": "string or null (они form, for perfective or compound future)",\n'
+    '  "imperative_singular": "string or null (imperative singular form if exists)",\n'
+    '  "imperative_plural": "string or null (imperative plural form if exists)",\n'
+    '  "present_active_participle": "string or null (if exists)",\n'
+    '  "present_passive_participle": "string or null (if exists)",\n'
+    '  "past_active_participle": "string or null (if exists)",\n'
+    '  "past_passive_participle": "string or null (if exists)",\n'
+    '  "present_gerund": "string or null (if exists)",\n'
+    '  "past_gerund": "string or null (if exists)"\n'
+    "}\n"
+    "Important: Use null for optional fields that don't exist or don't apply to this verb."
+)
+
+_PRONOUN_FORMAT_INSTRUCTIONS: Final[str] = (
+    "Your response must be valid JSON that matches this schema:\n"
+    "{\n"
+    '  "dictionary_form": "string (base form of the pronoun)",\n'
+    '  "english_translation": "string",\n'
+    + _case_forms_schema("singular", nullable=True)
+    + ",\n"
+    + _case_forms_schema("plural", nullable=True)
+    + ",\n"
+    + _case_forms_schema("masculine", nullable=True)
+    + ",\n"
+    + _case_forms_schema("feminine", nullable=True)
+    + ",\n"
+    + _case_forms_schema("neuter", nullable=True)
+    + ",\n"
+    + _case_forms_schema("plural_adjective_like", nullable=True)
+    + ",\n"
+    '  "notes": "string | null (special notes for irregular pronouns)"\n'
+    "}\n"
+    "Important: Use appropriate declension pattern:\n"
+    "- noun_like: for personal pronouns (я, ты, он, она, оно, мы, вы, они) - use singular/plural fields\n"
+    "- adjective_like: for demonstrative, possessive pronouns (этот, мой, наш) - use masculine/feminine/neuter/plural_adjective_like fields\n"
+    "- special: for irregular pronouns with unique declension patterns"
+)
+
+_NUMBER_FORMAT_INSTRUCTIONS: Final[str] = (
+    "Your response must be valid JSON that matches this schema:\n"
+    "{\n"
+    '  "dictionary_form": "string (base form of the number)",\n'
+    '  "english_translation": "string",\n'
+    + _case_forms_schema("masculine", nullable=True)
+    + ",\n"
+    + _case_forms_schema("feminine", nullable=True)
+    + ",\n"
+    + _case_forms_schema("neuter", nullable=True)
+    + ",\n"
+    + _case_forms_schema("singular", nullable=True)
+    + ",\n"
+    + _case_forms_schema("plural", nullable=True)
+    + ",\n"
+    '  "noun_agreement": {\n'
+    '    "nom": "string (what case nouns take when number is nominative)",\n'
+    '    "gen": "string (what case nouns take when number is genitive)",\n'
+    '    "dat": "string (what case nouns take when number is dative)",\n'
+    '    "acc": "string (what case nouns take when number is accusative)",\n'
+    '    "ins": "string (what case nouns take when number is instrumental)",\n'
+    '    "pre": "string (what case nouns take when number is prepositional)"\n'
+    "  } | null\n"
+    "}\n"
+)
+
+
+class GrammarModel(BaseModel):
+    """Base class for the grammar schemas parsed from LLM output."""
+
+    # Parsed grammar is read-only and shared between handlers; unknown keys
+    # from the LLM are dropped and model instances are never revalidated
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        revalidate_instances="never",
+        validate_assignment=False,
+    )
+
+    # Prompt text describing the JSON shape; set by each subclass
+    _format_instructions: ClassVar[str]
+
+    @classmethod
+    def get_format_instructions(cls) -> str:
+        return cls._format_instructions
+
 
-class WordClassification(BaseModel):
+class WordClassification(GrammarModel):
     word_type: WordType
     russian_word: str
     original_word: str
 
-    @staticmethod
-    def get_format_instructions() -> str:
-        return (
-            "Your response must be valid JSON that matches this schema:\n"
-            "{\n"
-            '  "word_type": "noun" | "verb" | "adjective" | "adverb" | "preposition" | "number" | "pronoun",\n'
-            '  "russian_word": "string (the Russian translation/form of the word)",\n'
-            '  "original_word": "string (the original input word)"\n'
-            "}"
-        )
+    _format_instructions = _WORD_CLASSIFICATION_FORMAT_INSTRUCTIONS
 
 
-class Noun(BaseModel):
+class Noun(GrammarModel):
     dictionary_form: str
     gender: Gender
     animacy: bool
-    singular: Dict[Case, str]
-    plural: Dict[Case, str]
+    singular: CaseForms
+    plural: CaseForms
     english_translation: str
 
-    @staticmethod
-    def get_format_instructions() -> str:
-        return (
-            "Your response must be valid JSON that matches this schema:\n"
-            "{\n"
-            '  "dictionary_form": "string (base form of the noun)",\n'
-            '  "gender": "masculine" | "feminine" | "neuter",\n'
-            '  "animacy": true | false,\n'
-            '  "singular": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  },\n"
-            '  "plural": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  },\n"
-            '  "english_translation": "string"\n'
-            "}"
-        )
-
-
-class Adjective(BaseModel):
+    _format_instructions = _NOUN_FORMAT_INSTRUCTIONS
+
+
+class Adjective(GrammarModel):
     dictionary_form: str
     english_translation: str
 
     # Masculine forms
-    masculine: Dict[Case, str]
+    masculine: CaseForms
 
     # Feminine forms
-    feminine: Dict[Case, str]
+    feminine: CaseForms
 
     # Neuter forms
-    neuter: Dict[Case, str]
+    neuter: CaseForms
 
     # Plural forms (same for all genders)
-    plural: Dict[Case, str]
+    plural: CaseForms
 
     # Short forms (not all adjectives have them)
     short_form_masculine: str = ""
@@ -93,56 +233,10 @@ class Adjective(BaseModel):
     comparative: str = ""
     superlative: str = ""
 
-    @staticmethod
-    def get_format_instructions() -> str:
-        return (
-            "Your response must be valid JSON that matches this schema:\n"
-            "{\n"
-            '  "dictionary_form": "string (base form of the adjective)",\n'
-            '  "english_translation": "string",\n'
-            '  "masculine": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  },\n"
-            '  "feminine": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  },\n"
-            '  "neuter": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  },\n"
-            '  "plural": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  },\n"
-            '  "short_form_masculine": "string (optional)",\n'
-            '  "short_form_feminine": "string (optional)",\n'
-            '  "short_form_neuter": "string (optional)",\n'
-            '  "short_form_plural": "string (optional)",\n'
-            '  "comparative": "string (optional)",\n'
-            '  "superlative": "string (optional)"\n'
-            "}"
-        )
-
-
-class Verb(BaseModel):
+    _format_instructions = _ADJECTIVE_FORMAT_INSTRUCTIONS
+
+
+class Verb(GrammarModel):
     dictionary_form: str
     english_translation: str
     aspect: Aspect
@@ -187,201 +281,58 @@ class Verb(BaseModel):
     present_gerund: Optional[str] = None
     past_gerund: Optional[str] = None
 
-    @staticmethod
-    def get_format_instructions() -> str:
-        return (
-            "Your response must be valid JSON that matches this schema:\n"
-            "{\n"
-            '  "dictionary_form": "string (infinitive form of the verb)",\n'
-            '  "english_translation": "string",\n'
-            '  "aspect": "perfective" | "imperfective" | "both",\n'
-            '  "aspect_pair": "string or null (the aspectual partner verb if it exists)",\n'
-            '  "directionality": "unidirectional" | "multidirectional" | "both" | "none",\n'
-            '  "present_first_singular": "string or null (я form, only for imperfective verbs)",\n'
-            '  "present_second_singular": "string or null (ты form, only for imperfective verbs)",\n'
-            '  "present_third_singular": "string or null (он/она/оно form, only for imperfective verbs)",\n'
-            '  "present_first_plural": "string or null (мы form, only for imperfective verbs)",\n'
-            '  "present_second_plural": "string or null (вы form, only for imperfective verbs)",\n'
-            '  "present_third_plural": "string or null (они form, only for imperfective verbs)",\n'
-            '  "past_masculine": "string (он form)",\n'
-            '  "past_feminine": "string (она form)",\n'
-            '  "past_neuter": "string (оно form)",\n'
-            '  "past_plural": "string (они form)",\n'
-            '  "future_first_singular": "string or null (я form, for perfective or compound future)",\n'
-            '  "future_second_singular": "string or null (ты form, for perfective or compound future)",\n'
-            '  "future_third_singular": "string or null (он/она/оно form, for perfective or compound future)",\n'
-            '  "future_first_plural": "string or null (мы form, for perfective or compound future)",\n'
-            '  "future_second_plural": "string or null (вы form, for perfective or compound future)",\n'
-            '  "future_third_plural": "string or null (они form, for perfective or compound future)",\n'
-            '  "imperative_singular": "string or null (imperative singular form if exists)",\n'
-            '  "imperative_plural": "string or null (imperative plural form if exists)",\n'
-            '  "present_active_participle": "string or null (if exists)",\n'
-            '  "present_passive_participle": "string or null (if exists)",\n'
-            '  "past_active_participle": "string or null (if exists)",\n'
-            '  "past_passive_participle": "string or null (if exists)",\n'
-            '  "present_gerund": "string or null (if exists)",\n'
-            '  "past_gerund": "string or null (if exists)"\n'
-            "}\n"
-            "Important: Use null for optional fields that don't exist or don't apply to this verb."
-        )
-
-
-class Pronoun(BaseModel):
+    _format_instructions = _VERB_FORMAT_INSTRUCTIONS
+
+
+class Pronoun(GrammarModel):
     dictionary_form: str
     english_translation: str
 
     # Declensions - structure depends on the pattern
     # For personal pronouns (noun-like): simple case forms
-    singular: Optional[Dict[Case, str]] = None
-    plural: Optional[Dict[Case, str]] = None
+    singular: Optional[CaseForms] = None
+    plural: Optional[CaseForms] = None
 
     # For adjective-like pronouns: gender-specific forms
-    masculine: Optional[Dict[Case, str]] = None
-    feminine: Optional[Dict[Case, str]] = None
-    neuter: Optional[Dict[Case, str]] = None
-    plural_adjective_like: Optional[Dict[Case, str]] = None
+    masculine: Optional[CaseForms] = None
+    feminine: Optional[CaseForms] = None
+    neuter: Optional[CaseForms] = None
+    plural_adjective_like: Optional[CaseForms] = None
 
     # Special notes for irregular pronouns
     notes: Optional[str] = None
 
-    @staticmethod
-    def get_format_instructions() -> str:
-        return (
-            "Your response must be valid JSON that matches this schema:\n"
-            "{\n"
-            '  "dictionary_form": "string (base form of the pronoun)",\n'
-            '  "english_translation": "string",\n'
-            '  "singular": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "plural": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "masculine": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "feminine": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "neuter": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "plural_adjective_like": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "notes": "string | null (special notes for irregular pronouns)"\n'
-            "}\n"
-            "Important: Use appropriate declension pattern:\n"
-            "- noun_like: for personal pronouns (я, ты, он, она, оно, мы, вы, они) - use singular/plural fields\n"
-            "- adjective_like: for demonstrative, possessive pronouns (этот, мой, наш) - use masculine/feminine/neuter/plural_adjective_like fields\n"
-            "- special: for irregular pronouns with unique declension patterns"
-        )
-
-
-class Number(BaseModel):
+    _format_instructions = _PRONOUN_FORMAT_INSTRUCTIONS
+
+
+class Number(GrammarModel):
     dictionary_form: str
     english_translation: str
 
     # Declension patterns vary by category
     # For "one" type - adjective-like declension with gender
-    masculine: Optional[Dict[Case, str]] = None
-    feminine: Optional[Dict[Case, str]] = None
-    neuter: Optional[Dict[Case, str]] = None
+    masculine: Optional[CaseForms] = None
+    feminine: Optional[CaseForms] = None
+    neuter: Optional[CaseForms] = None
 
     # For most other numbers - simpler case forms
-    singular: Optional[Dict[Case, str]] = None
-    plural: Optional[Dict[Case, str]] = None
+    singular: Optional[CaseForms] = None
+    plural: Optional[CaseForms] = None
 
     # Special case forms for compound numbers
     compound_forms: Optional[Dict[str, str]] = None
 
     # Agreement patterns (what case the counted noun takes)
-    noun_agreement: Optional[Dict[Case, str]] = None
-
-    @staticmethod
-    def get_format_instructions() -> str:
-        return (
-            "Your response must be valid JSON that matches this schema:\n"
-            "{\n"
-            '  "dictionary_form": "string (base form of the number)",\n'
-            '  "english_translation": "string",\n'
-            '  "masculine": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "feminine": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "neuter": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "singular": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "plural": {\n'
-            '    "nom": "string",\n'
-            '    "gen": "string",\n'
-            '    "dat": "string",\n'
-            '    "acc": "string",\n'
-            '    "ins": "string",\n'
-            '    "pre": "string"\n'
-            "  } | null,\n"
-            '  "noun_agreement": {\n'
-            '    "nom": "string (what case nouns take when number is nominative)",\n'
-            '    "gen": "string (what case nouns take when number is genitive)",\n'
-            '    "dat": "string (what case nouns take when number is dative)",\n'
-            '    "acc": "string (what case nouns take when number is accusative)",\n'
-            '    "ins": "string (what case nouns take when number is instrumental)",\n'
-            '    "pre": "string (what case nouns take when number is prepositional)"\n'
-            "  } | null\n"
-            "}\n"
-        )
+    noun_agreement: Optional[CaseForms] = None
+
+    _format_instructions = _NUMBER_FORMAT_INSTRUCTIONS
+
+
+# Detailed grammar model for each word type that supports analysis
+GRAMMAR_MODELS: Dict[str, type[GrammarModel]] = {
+    "noun": Noun,
+    "adjective": Adjective,
+    "verb": Verb,
+    "pronoun": Pronoun,
+    "number": Number,
+}
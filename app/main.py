@@ -1,51 +1,71 @@
-import threading
 import uvicorn
 import asyncio
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from telegram import Update
 from pydantic import SecretStr
 
 from app.my_telegram.bot import init_application
+from app.my_graph.bulk_text_processor import bulk_processor
 from app.config import settings, logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
 # Initialize FastAPI app
 app = FastAPI(title=settings.app_name)
 
-# Add CORS middleware
+# Add CORS middleware; the API takes no credentials and only serves GET
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_credentials=False,
+    allow_methods=["GET"],
     allow_headers=["*"],
 )
 
 
+# Pre-encoded body for the health endpoint; a fresh Response is built per
+# request because middleware appends to the response's header list
+ROOT_RESPONSE_BODY = b'{"Hello":"World!"}'
+
+
 @app.get("/")
 def read_root():
-    return {"Hello": "World!"}
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
+
 
+# Run the FastAPI server and the Telegram bot on a single event loop
+async def run_services():
+    # http="auto" picks the httptools parser when it is installed
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="0.0.0.0", port=8080, access_log=False)
+    )
+    bot = init_application(settings.token)
+    bulk_processor.bind_loop(asyncio.get_running_loop())
 
-# Function to run FastAPI server
-def run_fastapi():
-    uvicorn.run(app, host="0.0.0.0", port=8080, reload=False)
+    async with bot:
+        await bot.start()
+        await bot.updater.start_polling(allowed_updates=Update.ALL_TYPES)
+        logger.info("Telegram bot started")
 
+        # Serves until SIGINT/SIGTERM, which uvicorn traps for the whole process
+        try:
+            await server.serve()
+        finally:
+            await bot.updater.stop()
+            await bot.stop()
 
-# Main async function to start the Telegram bot
-def start_bot():
-    # Initialize the bot
-    bot = init_application(settings.token)
-    logger.info("Starting Telegram bot...")
-    bot.run_polling(allowed_updates=Update.ALL_TYPES)
+
+def main():
+    if uvloop is not None:
+        uvloop.run(run_services())
+    else:
+        asyncio.run(run_services())
 
 
 # Entry point
 if __name__ == "__main__":
-    # Start FastAPI server in background thread
-    thread = threading.Thread(target=run_fastapi, daemon=True)
-    thread.start()
-    logger.info("FastAPI server started in background")
-
-    # Run the Telegram bot in the main thread
-    start_bot()
+    main()
@@ -3,7 +3,10 @@
 import asyncio
 import logging
 import re
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 import uuid
 
@@ -15,23 +18,30 @@ from app.my_graph.tools import (
 
 logger = logging.getLogger(__name__)
 
+# Russian words, allowing hyphens and hard/soft signs inside a word; case is
+# ignored so matches can be lowercased one by one instead of the whole text
+RUSSIAN_WORD_PATTERN = re.compile(r"[а-яё]+[а-яёъь-]*[а-яё]|[а-яё]", re.IGNORECASE)
 
+
+@dataclass(slots=True)
 class BulkProcessingJob:
     """Represents a bulk processing job with status tracking."""
 
-    def __init__(self, job_id: str, text: str, user_id: int, total_words: int = 0):
-        self.job_id = job_id
-        self.text = text
-        self.user_id = user_id
-        self.total_words = total_words
-        self.processed_words = 0
-        self.generated_flashcards = 0
-        self.status = "pending"  # pending, processing, completed, failed
-        self.error_message = None
-        self.created_at = datetime.utcnow()
-        self.completed_at = None
-        self.failed_words = []
-        self.processed_word_types = {}
+    job_id: str
+    user_id: int
+    total_words: int = 0
+    processed_words: int = 0
+    generated_flashcards: int = 0
+    status: str = "pending"  # pending, processing, completed, failed
+    error_message: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    completed_at: Optional[datetime] = None
+    # time.monotonic() when the job finished, for clock-independent expiry
+    finished_at: Optional[float] = field(default=None, repr=False)
+    failed_words: List[Dict[str, str]] = field(default_factory=list)
+    processed_word_types: Dict[str, int] = field(default_factory=dict)
+    # Status dict of a finished job, which no longer changes
+    final_status: Optional[Dict[str, Any]] = field(default=None, repr=False)
 
 
 class BulkTextProcessor:
@@ -40,42 +50,78 @@ class BulkTextProcessor:
     def __init__(self):
         self.active_jobs: Dict[str, BulkProcessingJob] = {}
         self.completed_jobs: Dict[str, BulkProcessingJob] = {}
+        # Jobs of each user by job ID, in creation order
+        self.user_jobs: Dict[int, Dict[str, BulkProcessingJob]] = {}
+        # Guards the job dicts: jobs are started and listed from chatbot
+        # worker threads while they finish on the event loop. Per-word
+        # progress only ever changes on the loop and needs no lock.
+        self._jobs_lock = threading.Lock()
+        # Loop that runs jobs started from worker threads (chatbot turns run
+        # via asyncio.to_thread); bound by the application at startup
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        # Analyses in flight, shared by jobs that reach the same word together
+        self._pending_analyses: Dict[str, asyncio.Task] = {}
+        # Caps the words in flight across all jobs, so concurrent jobs share
+        # bulk_concurrency instead of each adding its own
+        self._word_slots = asyncio.Semaphore(settings.bulk_concurrency)
+        # Running job tasks; the loop itself only keeps weak references
+        self._job_tasks: Set[asyncio.Task] = set()
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        """Set the event loop that runs jobs started outside of it."""
+        self.loop = loop
+
+    def _schedule(self, coro):
+        """Run a job coroutine on the current loop, or on the bound loop when
+        called from a worker thread."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self.loop is None:
+                coro.close()
+                raise RuntimeError("No event loop available for bulk processing")
+            self.loop.call_soon_threadsafe(self._start_job_task, coro)
+        else:
+            self._start_job_task(coro)
+
+    def _start_job_task(self, coro):
+        """Start a job task on the running loop and keep it referenced."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._job_tasks.add(task)
+        task.add_done_callback(self._job_tasks.discard)
 
     def extract_russian_words(self, text: str) -> List[str]:
         """Extract Russian words from text, filtering out common words and non-Russian text."""
-        # Define Russian alphabet pattern
-        russian_pattern = r"[а-яё]+[а-яёъь-]*[а-яё]|[а-яё]"
-
-        # Extract Russian words
-        russian_words = re.findall(russian_pattern, text.lower())
-
-        # Filter out common words and very short words
-        filtered_words = []
-        seen_words = set()
-
-        for word in russian_words:
-            if len(word) >= 3 and word not in seen_words:
-                filtered_words.append(word)
-                seen_words.add(word)
-
-        return filtered_words
+        # Keep words of 3+ letters, deduplicated in order of first appearance
+        return list(
+            dict.fromkeys(
+                word.lower()
+                for word in RUSSIAN_WORD_PATTERN.findall(text)
+                if len(word) >= 3
+            )
+        )
 
     def start_bulk_processing(self, text: str, user_id: int) -> str:
         """Start a bulk processing job and return the job ID."""
         job_id = str(uuid.uuid4())
 
+        # Drop expired jobs; this stops at the first job that is still fresh
+        self.cleanup_old_jobs()
+
         # Extract Russian words
         russian_words = self.extract_russian_words(text)
 
-        # Create job
+        # Create job; it keeps only the word count, not the pasted text
         job = BulkProcessingJob(
-            job_id=job_id, text=text, user_id=user_id, total_words=len(russian_words)
+            job_id=job_id, user_id=user_id, total_words=len(russian_words)
         )
 
-        self.active_jobs[job_id] = job
+        with self._jobs_lock:
+            self.active_jobs[job_id] = job
+            self.user_jobs.setdefault(user_id, {})[job_id] = job
 
         # Start processing asynchronously
-        asyncio.create_task(self._process_job_async(job, russian_words))
+        self._schedule(self._process_job_async(job, russian_words))
 
         logger.info(
             f"Started bulk processing job {job_id} for user {user_id} with {len(russian_words)} words"
@@ -83,83 +129,102 @@ class BulkTextProcessor:
 
         return job_id
 
+    async def _analyze_word(self, word: str) -> Dict[str, Any]:
+        """Analyze a word, sharing the analysis with jobs that reach it together.
+
+        Finished analyses are reused through the grammar tool's own cache.
+        """
+        pending = self._pending_analyses.get(word)
+        if pending is None:
+            pending = asyncio.create_task(self._run_analysis(word))
+            self._pending_analyses[word] = pending
+
+        # Shielded so one cancelled waiter does not cancel the others
+        return await asyncio.shield(pending)
+
+    async def _run_analysis(self, word: str) -> Dict[str, Any]:
+        """Analyze a word in a thread, as the grammar tool blocks on LLM calls."""
+        try:
+            return await asyncio.to_thread(analyze_russian_grammar_impl, word)
+        finally:
+            del self._pending_analyses[word]
+
+    async def _process_word(self, job: BulkProcessingJob, word: str) -> int:
+        """Analyze one word and generate its flashcards, returning the number
+        of flashcards generated."""
+        cards_generated = 0
+        try:
+            analysis_result = await self._analyze_word(word)
+
+            if analysis_result.get("success"):
+                # Generate flashcards; this saves them for the job's user, so it
+                # runs for every job even when the analysis was cached
+                flashcard_result = await asyncio.to_thread(
+                    generate_flashcards_from_analysis_impl,
+                    analysis_data=analysis_result,
+                    user_id=job.user_id,
+                )
+
+                if flashcard_result.get("success"):
+                    cards_generated = flashcard_result.get("flashcards_generated", 0)
+
+                    # Track word types
+                    word_type = flashcard_result.get("word_type")
+                    if word_type:
+                        job.processed_word_types[word_type] = (
+                            job.processed_word_types.get(word_type, 0) + 1
+                        )
+
+                    logger.info(
+                        f"Job {job.job_id}: Generated {cards_generated} flashcards for word '{word}'"
+                    )
+                else:
+                    logger.warning(
+                        f"Job {job.job_id}: Failed to generate flashcards for word '{word}': {flashcard_result.get('error')}"
+                    )
+                    job.failed_words.append(
+                        {
+                            "word": word,
+                            "error": "flashcard_generation_failed",
+                        }
+                    )
+            else:
+                logger.warning(
+                    f"Job {job.job_id}: Failed to analyze word '{word}': {analysis_result.get('error')}"
+                )
+                job.failed_words.append({"word": word, "error": "analysis_failed"})
+
+        except Exception as e:
+            logger.error(f"Job {job.job_id}: Error processing word '{word}': {e}")
+            job.failed_words.append({"word": word, "error": str(e)})
+
+        job.processed_words += 1
+        return cards_generated
+
     async def _process_job_async(self, job: BulkProcessingJob, words: List[str]):
         """Process a job asynchronously."""
         try:
             job.status = "processing"
-            total_flashcards = 0
-
-            # Process words in small batches to avoid overwhelming the system
-            batch_size = 3
-            for i in range(0, len(words), batch_size):
-                batch = words[i : i + batch_size]
-
-                # Process batch
-                for word in batch:
-                    try:
-                        # Analyze grammar
-                        analysis_result = analyze_russian_grammar_impl(word)
-
-                        if analysis_result.get("success"):
-                            # Generate flashcards
-                            flashcard_result = generate_flashcards_from_analysis_impl(
-                                analysis_data=analysis_result
-                            )
-
-                            if flashcard_result.get("success"):
-                                cards_generated = flashcard_result.get(
-                                    "flashcards_generated", 0
-                                )
-                                total_flashcards += cards_generated
-
-                                # Track word types
-                                word_type = flashcard_result.get("word_type")
-                                if word_type:
-                                    job.processed_word_types[word_type] = (
-                                        job.processed_word_types.get(word_type, 0) + 1
-                                    )
-
-                                logger.info(
-                                    f"Job {job.job_id}: Generated {cards_generated} flashcards for word '{word}'"
-                                )
-                            else:
-                                logger.warning(
-                                    f"Job {job.job_id}: Failed to generate flashcards for word '{word}': {flashcard_result.get('error')}"
-                                )
-                                job.failed_words.append(
-                                    {
-                                        "word": word,
-                                        "error": "flashcard_generation_failed",
-                                    }
-                                )
-                        else:
-                            logger.warning(
-                                f"Job {job.job_id}: Failed to analyze word '{word}': {analysis_result.get('error')}"
-                            )
-                            job.failed_words.append(
-                                {"word": word, "error": "analysis_failed"}
-                            )
-
-                    except Exception as e:
-                        logger.error(
-                            f"Job {job.job_id}: Error processing word '{word}': {e}"
-                        )
-                        job.failed_words.append({"word": word, "error": str(e)})
 
-                    job.processed_words += 1
+            # Start each word as soon as a slot frees up, keeping at most
+            # bulk_concurrency words in flight across all jobs
+            tasks = []
+            async with asyncio.TaskGroup() as tg:
+                for word in words:
+                    await self._word_slots.acquire()
+                    task = tg.create_task(self._process_word(job, word))
+                    task.add_done_callback(lambda _: self._word_slots.release())
+                    tasks.append(task)
 
-                # Small delay between batches to prevent overwhelming the system
-                await asyncio.sleep(1)
+            total_flashcards = sum(task.result() for task in tasks)
 
             # Mark job as completed
             job.status = "completed"
             job.generated_flashcards = total_flashcards
+            job.finished_at = time.monotonic()
             job.completed_at = datetime.utcnow()
 
-            # Move to completed jobs
-            self.completed_jobs[job.job_id] = job
-            if job.job_id in self.active_jobs:
-                del self.active_jobs[job.job_id]
+            self._move_to_completed(job)
 
             logger.info(
                 f"Completed bulk processing job {job.job_id}: {total_flashcards} flashcards generated from {job.processed_words} words"
@@ -169,12 +234,17 @@ class BulkTextProcessor:
             logger.error(f"Error in bulk processing job {job.job_id}: {e}")
             job.status = "failed"
             job.error_message = str(e)
+            job.finished_at = time.monotonic()
             job.completed_at = datetime.utcnow()
 
             # Move to completed jobs even if failed
+            self._move_to_completed(job)
+
+    def _move_to_completed(self, job: BulkProcessingJob):
+        """Move a finished job from the active to the completed jobs."""
+        with self._jobs_lock:
             self.completed_jobs[job.job_id] = job
-            if job.job_id in self.active_jobs:
-                del self.active_jobs[job.job_id]
+            self.active_jobs.pop(job.job_id, None)
 
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get the status of a processing job."""
@@ -183,11 +253,23 @@ class BulkTextProcessor:
         if not job:
             return None
 
+        return self._job_status(job)
+
+    def _job_status(self, job: BulkProcessingJob) -> Dict[str, Any]:
+        """Build the status dict reported for a job."""
+        if job.final_status is not None:
+            return job.final_status
+
+        # completed_at is set last when a job finishes, so if it was set before
+        # the status is built, every other field is already final. Read once,
+        # as the job may finish on the loop while this runs in a worker thread.
+        completed_at = job.completed_at
+
         progress_pct = 0
         if job.total_words > 0:
             progress_pct = (job.processed_words / job.total_words) * 100
 
-        return {
+        status = {
             "job_id": job.job_id,
             "status": job.status,
             "progress_percentage": round(progress_pct, 1),
@@ -195,46 +277,45 @@ class BulkTextProcessor:
             "total_words": job.total_words,
             "generated_flashcards": job.generated_flashcards,
             "failed_words_count": len(job.failed_words),
-            "processed_word_types": job.processed_word_types,
+            # Copied, as the loop keeps updating it while a job is active
+            "processed_word_types": dict(job.processed_word_types),
             "created_at": job.created_at.isoformat(),
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
             "error_message": job.error_message,
         }
 
-    def get_user_jobs(self, user_id: int) -> List[Dict[str, Any]]:
-        """Get all jobs for a specific user."""
-        user_jobs = []
-
-        # Check active jobs
-        for job in self.active_jobs.values():
-            if job.user_id == user_id:
-                status = self.get_job_status(job.job_id)
-                if status:
-                    user_jobs.append(status)
+        if completed_at is not None:
+            job.final_status = status
 
-        # Check completed jobs
-        for job in self.completed_jobs.values():
-            if job.user_id == user_id:
-                status = self.get_job_status(job.job_id)
-                if status:
-                    user_jobs.append(status)
+        return status
 
-        # Sort by creation time, newest first
-        user_jobs.sort(key=lambda x: x["created_at"], reverse=True)
-
-        return user_jobs
+    def get_user_jobs(self, user_id: int) -> List[Dict[str, Any]]:
+        """Get all jobs for a specific user, newest first."""
+        with self._jobs_lock:
+            jobs = list(self.user_jobs.get(user_id, {}).values())
+        return [self._job_status(job) for job in reversed(jobs)]
 
     def cleanup_old_jobs(self, max_age_hours: int = 24):
         """Clean up old completed jobs to prevent memory issues."""
-        cutoff_time = datetime.utcnow().timestamp() - (max_age_hours * 3600)
-
-        jobs_to_remove = []
-        for job_id, job in self.completed_jobs.items():
-            if job.completed_at and job.completed_at.timestamp() < cutoff_time:
+        cutoff_time = time.monotonic() - (max_age_hours * 3600)
+
+        with self._jobs_lock:
+            # Jobs are added to completed_jobs as they finish, so the expired
+            # ones are all at the front
+            jobs_to_remove = []
+            for job_id, job in self.completed_jobs.items():
+                if job.finished_at >= cutoff_time:
+                    break
                 jobs_to_remove.append(job_id)
 
+            for job_id in jobs_to_remove:
+                job = self.completed_jobs.pop(job_id)
+                user_jobs = self.user_jobs[job.user_id]
+                del user_jobs[job_id]
+                if not user_jobs:
+                    del self.user_jobs[job.user_id]
+
         for job_id in jobs_to_remove:
-            del self.completed_jobs[job_id]
             logger.info(f"Cleaned up old job {job_id}")
 
 
@@ -1,21 +1,38 @@
 """Conversational Russian tutor chatbot using LangGraph with tools."""
 
-import json
+import asyncio
 import logging
-from typing import List, Dict, Optional, TypedDict, Literal, Union, Any
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    TypedDict,
+    Union,
+)
 
-from pydantic import SecretStr
+import orjson
+from pydantic import BaseModel, SecretStr
 from langgraph.graph import START, StateGraph, END
 from langgraph.types import StreamWriter
 from langgraph.checkpoint.memory import MemorySaver
-from langchain_core.runnables import RunnableConfig
+from langchain_core.caches import InMemoryCache
+from langchain_core.load import dumps
+from langchain_core.outputs import ChatGeneration
+from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_core.messages import (
     BaseMessage,
     HumanMessage,
     AIMessage,
     SystemMessage,
     ToolMessage,
+    message_chunk_to_message,
 )
+from langchain_core.messages.utils import count_tokens_approximately, trim_messages
 from langchain_core.tools import tool
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_openai import ChatOpenAI
@@ -34,6 +51,17 @@ from app.my_graph.tools import (
 
 logger = logging.getLogger(__name__)
 
+# Conversation history sent with each turn, counted approximately from the
+# message text so no tokenizer has to be loaded
+MAX_HISTORY_TOKENS = 4000
+
+
+def _tool_result_default(obj: Any) -> Any:
+    """JSON fallback for tool results: dump pydantic models, str() anything else."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
 
 class ChatbotState(TypedDict):
     """State for the conversational Russian tutor chatbot."""
@@ -49,28 +77,142 @@ class ChatbotState(TypedDict):
     conversation_context: Optional[Dict[str, Any]]
 
 
-class ConversationalRussianTutor:
-    """A conversational Russian tutor chatbot using LangGraph with tools."""
+@tool
+def analyze_russian_grammar(russian_word: str) -> Dict[str, Any]:
+    """Analyze a Russian word's grammar including cases, gender, conjugations, etc.
 
-    def __init__(self, api_key: SecretStr, model: str = "gpt-4o"):
-        self.api_key = api_key
-        self.default_model = model
+    Args:
+        russian_word: A single Russian word to analyze
 
-        # Create LLM with tool binding
-        self.llm = ChatOpenAI(api_key=api_key, model=model)
+    Returns:
+        Dictionary with grammar analysis including word type, forms, and metadata
+    """
+    return analyze_russian_grammar_impl(russian_word)
 
-        # Create tools from class methods
-        self.tools = self._create_tools()
 
-        # Bind tools to LLM
-        self.llm_with_tools = self.llm.bind_tools(self.tools)
+@tool
+def correct_multilingual_mistakes(mixed_text: str) -> Dict[str, Any]:
+    """Correct mixed-language text and grammatical mistakes in Russian.
 
-        # Build the chatbot graph
-        self.graph = self._build_chatbot_graph()
+    Args:
+        mixed_text: Text that may contain Russian mixed with English/German words or grammatical errors
+
+    Returns:
+        Dictionary with original text, corrected version, and explanation of mistakes
+    """
+    return correct_multilingual_mistakes_impl(mixed_text)
+
+
+@tool
+def generate_flashcards_from_analysis(
+    analysis_data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    focus_areas: Optional[List[str]] = None,
+    word: Optional[str] = None,
+    user_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Generate flashcards from grammar analysis results.
+
+    Args:
+        analysis_data: Results from grammar analysis (optional if word is provided)
+        focus_areas: Optional list of specific areas to focus on (e.g., ['cases', 'gender'])
+        word: Optional word to analyze if analysis_data not provided
+        user_id: User ID for associating flashcards with the user
+
+    Returns:
+        Dictionary with generated flashcards and count
+    """
+    return generate_flashcards_from_analysis_impl(
+        analysis_data, focus_areas, word, user_id
+    )
+
+
+@tool
+def translate_phrase(text: str, from_lang: str, to_lang: str) -> Dict[str, Any]:
+    """Translate a phrase between Russian, English, and German.
 
-        # System message for the chatbot
-        self.system_message = SystemMessage(
-            content="""You are a helpful Russian language tutor assistant. You can help users:
+    Args:
+        text: Text to translate
+        from_lang: Source language (russian, english, german)
+        to_lang: Target language (russian, english, german)
+
+    Returns:
+        Dictionary with translation and additional context
+    """
+    return translate_phrase_impl(text, from_lang, to_lang)
+
+
+@tool
+def generate_example_sentences(
+    word: str, grammatical_context: str, theme: Optional[str] = None
+) -> Dict[str, Any]:
+    """Generate example sentences for a Russian word in specific grammatical contexts.
+
+    Args:
+        word: Russian word to create examples for
+        grammatical_context: Grammar context (e.g., "accusative case", "past tense")
+        theme: Optional theme for examples (e.g., "family", "cooking", "travel")
+
+    Returns:
+        Dictionary with generated example sentences
+    """
+    return generate_example_sentences_impl(word, grammatical_context, theme)
+
+
+@tool
+def process_bulk_text_for_flashcards(
+    text: str, user_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Process a large text or multiple sentences asynchronously to generate flashcards.
+
+    Use this tool when the user provides:
+    - Long texts or paragraphs
+    - Multiple sentences
+    - Lists of words
+    - Any text that contains multiple Russian words to analyze
+
+    This tool will automatically extract Russian words, analyze them, and generate flashcards
+    in the background. The user will be notified when processing is complete.
+
+    Args:
+        text: The text containing Russian words to process (can be sentences, paragraphs, or word lists)
+        user_id: The user's ID for tracking the job
+
+    Returns:
+        Dictionary with job ID and processing information
+    """
+    return process_bulk_text_for_flashcards_impl(text, user_id)
+
+
+@tool
+def check_bulk_processing_status(
+    job_id: Optional[str] = None, user_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Check the status of bulk text processing jobs.
+
+    Args:
+        job_id: Specific job ID to check (optional)
+        user_id: User ID to get all jobs for that user (optional)
+
+    Returns:
+        Dictionary with job status information
+    """
+    return check_bulk_processing_status_impl(job_id, user_id)
+
+
+# Tools that act on behalf of the user and are given the caller's user_id
+_USER_ID_TOOLS = frozenset(
+    {
+        "process_bulk_text_for_flashcards",
+        "check_bulk_processing_status",
+        "generate_flashcards_from_analysis",
+    }
+)
+
+
+# Sent first on every turn. It never changes, so the provider can serve this
+# prefix of the prompt from its prompt cache instead of processing it again.
+SYSTEM_MESSAGE = SystemMessage(
+    content="""You are a helpful Russian language tutor assistant. You can help users:
 
 1. **Analyze Russian grammar** - Break down words and explain their grammatical forms
 2. **Correct mistakes** - Fix mixed-language text and grammatical errors  
@@ -112,135 +254,61 @@ class ConversationalRussianTutor:
 - For bulk processing, inform users that the process runs in the background and they can check the database later
 
 Always explain what you're doing and ask for user confirmation before creating flashcards."""
+)
+
+
+# The tools only call module-level implementations, so they are created once
+# and shared by every tutor instance
+TUTOR_TOOLS = [
+    analyze_russian_grammar,
+    generate_flashcards_from_analysis,
+    correct_multilingual_mistakes,
+    translate_phrase,
+    generate_example_sentences,
+    process_bulk_text_for_flashcards,
+    check_bulk_processing_status,
+]
+
+
+# Replies by conversation and model. The key is the whole conversation,
+# including the system message, so a reply is only reused for an identical
+# conversation and never depends on who sent it.
+_response_cache = InMemoryCache(maxsize=1024)
+
+
+# Binding converts every tool schema, which costs more than building the
+# client, so each per-user tutor reuses the bound client for its key and model
+@lru_cache(maxsize=32)
+def _get_bound_llm(api_key: str, model: str) -> Runnable:
+    """Get a shared LLM client with the tutor tools bound to it."""
+    return ChatOpenAI(
+        api_key=SecretStr(api_key), model=model, temperature=0
+    ).bind_tools(TUTOR_TOOLS)
+
+
+class ConversationalRussianTutor:
+    """A conversational Russian tutor chatbot using LangGraph with tools."""
+
+    def __init__(self, api_key: SecretStr, model: str = "gpt-4o"):
+        self.api_key = api_key
+        self.default_model = model
+
+        self.tools = TUTOR_TOOLS
+        self._tool_by_name = {tool.name: tool for tool in self.tools}
+
+        # LLM with the tools bound, shared by tutors with the same key and model
+        self.llm_with_tools = _get_bound_llm(api_key.get_secret_value(), model)
+        self.llm = self.llm_with_tools.bound
+        # Replies to tool results mostly restate them, so the cheaper model
+        # writes those instead
+        self.fast_llm_with_tools = _get_bound_llm(
+            api_key.get_secret_value(), settings.fast_llm_model
         )
 
-    def _create_tools(self):
-        """Create tool instances from class methods."""
-
-        @tool
-        def analyze_russian_grammar(russian_word: str) -> Dict[str, Any]:
-            """Analyze a Russian word's grammar including cases, gender, conjugations, etc.
-
-            Args:
-                russian_word: A single Russian word to analyze
-
-            Returns:
-                Dictionary with grammar analysis including word type, forms, and metadata
-            """
-            return analyze_russian_grammar_impl(russian_word)
-
-        @tool
-        def correct_multilingual_mistakes(mixed_text: str) -> Dict[str, Any]:
-            """Correct mixed-language text and grammatical mistakes in Russian.
-
-            Args:
-                mixed_text: Text that may contain Russian mixed with English/German words or grammatical errors
-
-            Returns:
-                Dictionary with original text, corrected version, and explanation of mistakes
-            """
-            return correct_multilingual_mistakes_impl(mixed_text)
-
-        @tool
-        def generate_flashcards_from_analysis(
-            analysis_data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
-            focus_areas: Optional[List[str]] = None,
-            word: Optional[str] = None,
-            user_id: Optional[int] = None,
-        ) -> Dict[str, Any]:
-            """Generate flashcards from grammar analysis results.
-
-            Args:
-                analysis_data: Results from grammar analysis (optional if word is provided)
-                focus_areas: Optional list of specific areas to focus on (e.g., ['cases', 'gender'])
-                word: Optional word to analyze if analysis_data not provided
-                user_id: User ID for associating flashcards with the user
-
-            Returns:
-                Dictionary with generated flashcards and count
-            """
-            return generate_flashcards_from_analysis_impl(
-                analysis_data, focus_areas, word, user_id
-            )
+        # Build the chatbot graph
+        self.graph = self._build_chatbot_graph()
 
-        @tool
-        def translate_phrase(text: str, from_lang: str, to_lang: str) -> Dict[str, Any]:
-            """Translate a phrase between Russian, English, and German.
-
-            Args:
-                text: Text to translate
-                from_lang: Source language (russian, english, german)
-                to_lang: Target language (russian, english, german)
-
-            Returns:
-                Dictionary with translation and additional context
-            """
-            return translate_phrase_impl(text, from_lang, to_lang)
-
-        @tool
-        def generate_example_sentences(
-            word: str, grammatical_context: str, theme: Optional[str] = None
-        ) -> Dict[str, Any]:
-            """Generate example sentences for a Russian word in specific grammatical contexts.
-
-            Args:
-                word: Russian word to create examples for
-                grammatical_context: Grammar context (e.g., "accusative case", "past tense")
-                theme: Optional theme for examples (e.g., "family", "cooking", "travel")
-
-            Returns:
-                Dictionary with generated example sentences
-            """
-            return generate_example_sentences_impl(word, grammatical_context, theme)
-
-        @tool
-        def process_bulk_text_for_flashcards(
-            text: str, user_id: Optional[int] = None
-        ) -> Dict[str, Any]:
-            """Process a large text or multiple sentences asynchronously to generate flashcards.
-
-            Use this tool when the user provides:
-            - Long texts or paragraphs
-            - Multiple sentences
-            - Lists of words
-            - Any text that contains multiple Russian words to analyze
-
-            This tool will automatically extract Russian words, analyze them, and generate flashcards
-            in the background. The user will be notified when processing is complete.
-
-            Args:
-                text: The text containing Russian words to process (can be sentences, paragraphs, or word lists)
-                user_id: The user's ID for tracking the job
-
-            Returns:
-                Dictionary with job ID and processing information
-            """
-            return process_bulk_text_for_flashcards_impl(text, user_id)
-
-        @tool
-        def check_bulk_processing_status(
-            job_id: Optional[str] = None, user_id: Optional[int] = None
-        ) -> Dict[str, Any]:
-            """Check the status of bulk text processing jobs.
-
-            Args:
-                job_id: Specific job ID to check (optional)
-                user_id: User ID to get all jobs for that user (optional)
-
-            Returns:
-                Dictionary with job status information
-            """
-            return check_bulk_processing_status_impl(job_id, user_id)
-
-        return [
-            analyze_russian_grammar,
-            generate_flashcards_from_analysis,
-            correct_multilingual_mistakes,
-            translate_phrase,
-            generate_example_sentences,
-            process_bulk_text_for_flashcards,
-            check_bulk_processing_status,
-        ]
+        self.system_message = SYSTEM_MESSAGE
 
     def _build_chatbot_graph(self) -> Any:
         """Build the LangGraph for the conversational chatbot."""
@@ -268,22 +336,57 @@ Always explain what you're doing and ask for user confirmation before creating f
 
         return workflow.compile()
 
-    def _chat_node(self, state: ChatbotState) -> ChatbotState:
+    async def _chat_node(
+        self, state: ChatbotState, *, writer: StreamWriter
+    ) -> ChatbotState:
         """Main chat node that handles conversation and tool calling."""
         try:
             messages = state.get("messages", [])
 
-            # Add system message if this is the start of conversation
-            if not messages or not isinstance(messages[0], SystemMessage):
-                messages = [self.system_message] + messages
-
-            # Get AI response
-            response = self.llm_with_tools.invoke(messages)
+            # Start with the tutor's system message, replacing any other one
+            # the history carries so the prompt prefix is always identical
+            if messages and isinstance(messages[0], SystemMessage):
+                messages[0] = self.system_message
+            else:
+                messages.insert(0, self.system_message)
+
+            if isinstance(messages[-1], ToolMessage):
+                llm_with_tools = self.fast_llm_with_tools
+                model_name = settings.fast_llm_model
+            else:
+                llm_with_tools = self.llm_with_tools
+                model_name = self.default_model
+
+            # Each run of this node writes a new reply, so a caller showing
+            # the tokens drops those of the previous one (e.g. before tools ran)
+            writer({"reply_start": True})
+
+            # The same conversation gets the same reply at temperature 0, so
+            # it is answered from the cache; astream itself never reads it
+            prompt = dumps(messages)
+            cached = await _response_cache.alookup(prompt, model_name)
+            if cached:
+                response = cached[0].message
+                if response.content:
+                    writer({"token": response.content})
+            else:
+                # Stream the AI response, passing text tokens to the writer so
+                # a caller streaming the graph can show them as they arrive
+                response = None
+                async for chunk in llm_with_tools.astream(messages):
+                    response = chunk if response is None else response + chunk
+                    if chunk.content:
+                        writer({"token": chunk.content})
+                response = message_chunk_to_message(response)
+                await _response_cache.aupdate(
+                    prompt, model_name, [ChatGeneration(message=response)]
+                )
 
-            # Add the response to messages
-            updated_messages = messages + [response]
+            # The list is owned by this graph run, so append the response in
+            # place instead of copying the whole history every turn
+            messages.append(response)
 
-            return {**state, "messages": updated_messages}
+            return {"messages": messages}
 
         except Exception as e:
             logger.error(f"Error in chat node: {e}")
@@ -298,16 +401,14 @@ Always explain what you're doing and ask for user confirmation before creating f
             error_message = AIMessage(
                 content="I encountered an error. Please try again."
             )
-            return {**state, "messages": current_messages + [error_message]}
+            return {"messages": current_messages + [error_message]}
 
-    def _execute_tools_node(self, state: ChatbotState) -> ChatbotState:
+    async def _execute_tools_node(self, state: ChatbotState) -> ChatbotState:
         """Execute any tools that were called by the AI."""
         try:
             messages = state.get("messages", [])
             last_message = messages[-1] if messages else None
 
-            tool_messages = []
-
             # Validate that we have tool calls to execute
             if (
                 not last_message
@@ -317,62 +418,25 @@ Always explain what you're doing and ask for user confirmation before creating f
                 logger.warning(
                     "Tool execution called but no tool calls found in last message"
                 )
-                return {**state, "messages": messages}
+                return {"messages": messages}
 
             # Get user_id from state for tools that need it
             user_id = state.get("user_id")
 
-            # Execute the tool calls
-            for tool_call in last_message.tool_calls:
-                tool_name = tool_call["name"]
-                tool_args = tool_call["args"]
-                tool_call_id = tool_call["id"]
-
-                # Inject user_id for tools that need it
-                if (
-                    tool_name
-                    in [
-                        "process_bulk_text_for_flashcards",
-                        "check_bulk_processing_status",
-                        "generate_flashcards_from_analysis",
-                    ]
-                    and user_id
-                ):
-                    if "user_id" not in tool_args:
-                        tool_args["user_id"] = user_id
-
-                # Find and execute the tool
-                tool_result = None
-                for tool in self.tools:
-                    if tool.name == tool_name:
-                        try:
-                            tool_result = tool.invoke(tool_args)
-                            logger.info(
-                                f"Executed tool {tool_name} with result: {tool_result}"
-                            )
-                        except Exception as e:
-                            logger.error(f"Error executing tool {tool_name}: {e}")
-                            tool_result = {"error": str(e), "success": False}
-                        break
-
-                if tool_result is None:
-                    tool_result = {
-                        "error": f"Tool {tool_name} not found",
-                        "success": False,
-                    }
-
-                # Create a ToolMessage with the result
-                tool_message = ToolMessage(
-                    content=str(tool_result), tool_call_id=tool_call_id
+            # The tool calls are independent and mostly wait on OpenAI or the
+            # database, so run them concurrently
+            tool_messages = await asyncio.gather(
+                *(
+                    self._execute_tool_call(tool_call, user_id)
+                    for tool_call in last_message.tool_calls
                 )
-                tool_messages.append(tool_message)
+            )
 
             # Add tool messages to the conversation
-            updated_messages = messages + tool_messages
+            messages.extend(tool_messages)
 
             return {
-                **state,
-                "messages": updated_messages,
+                "messages": messages,
                 "tool_results": {
                     msg.tool_call_id: msg.content for msg in tool_messages
                 },
@@ -382,7 +446,48 @@ Always explain what you're doing and ask for user confirmation before creating f
             logger.error(f"Error in execute tools node: {e}")
             # If there's an error during tool execution, return the state without tool messages
             # to prevent corrupting the conversation flow
-            return {**state, "tool_results": {"error": str(e)}}
+            return {"tool_results": {"error": str(e)}}
+
+    async def _execute_tool_call(
+        self, tool_call: Dict[str, Any], user_id: Optional[int]
+    ) -> ToolMessage:
+        """Execute a single tool call and wrap its result in a ToolMessage."""
+        tool_name = tool_call["name"]
+        tool_call_id = tool_call["id"]
+
+        # Inject the caller's user_id for tools that need it. The args are
+        # copied because the AI message may be a cached reply shared with
+        # other users, and the caller's ID always wins over one in the args.
+        tool_args = dict(tool_call["args"])
+        if user_id is not None and tool_name in _USER_ID_TOOLS:
+            tool_args["user_id"] = user_id
+
+        # Find and execute the tool
+        tool = self._tool_by_name.get(tool_name)
+        if tool is None:
+            tool_result = {
+                "error": f"Tool {tool_name} not found",
+                "success": False,
+            }
+        else:
+            try:
+                # Sync tools are run in an executor by ainvoke
+                tool_result = await tool.ainvoke(tool_args)
+                logger.info(f"Executed tool {tool_name} with result: {tool_result}")
+            except Exception as e:
+                logger.error(f"Error executing tool {tool_name}: {e}")
+                tool_result = {"error": str(e), "success": False}
+
+        # Create a ToolMessage with the result as JSON, which the LLM reads more
+        # reliably than a Python repr; orjson keeps Cyrillic as-is, not \u-escaped
+        return ToolMessage(
+            content=orjson.dumps(
+                tool_result,
+                default=_tool_result_default,
+                option=orjson.OPT_NON_STR_KEYS,
+            ).decode(),
+            tool_call_id=tool_call_id,
+        )
 
     def _should_execute_tools(self, state: ChatbotState) -> str:
         """Determine if we should execute tools or respond directly."""
@@ -397,25 +502,42 @@ Always explain what you're doing and ask for user confirmation before creating f
             return "tools"
         return "respond"
 
-    def chat(
+    async def chat_async(
         self,
         user_message: str,
         conversation_history: Optional[List[BaseMessage]] = None,
         user_id: Optional[int] = None,
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_reply_start: Optional[Callable[[], Awaitable[None]]] = None,
     ) -> Dict[str, Any]:
         """Process a user message and return the chatbot's response.
 
         Args:
             user_message: The user's input message
-            conversation_history: Optional previous conversation messages
+            conversation_history: Optional previous conversation messages,
+                of which only the last MAX_HISTORY_TOKENS worth are sent
             user_id: Optional user ID for tool execution context
+            on_token: Optional coroutine called with each response token as it
+                is generated
+            on_reply_start: Optional coroutine called before the tokens of each
+                new response, as tool calls make the tutor respond more than once
 
         Returns:
             Dictionary with the AI's response and updated conversation state
         """
         try:
-            # Prepare initial state
-            messages = conversation_history or []
+            # Prepare initial state, keeping only the most recent history so
+            # prompt size and latency stop growing with the conversation.
+            # Trimmed history starts on a human message, so no tool result
+            # is left without the AI message that called the tool.
+            messages = trim_messages(
+                conversation_history or [],
+                max_tokens=MAX_HISTORY_TOKENS,
+                token_counter=count_tokens_approximately,
+                strategy="last",
+                start_on="human",
+                include_system=True,
+            )
             messages.append(HumanMessage(content=user_message))
 
             initial_state = {
@@ -429,7 +551,20 @@ Always explain what you're doing and ask for user confirmation before creating f
             }
 
             # Execute the graph
-            result = self.graph.invoke(initial_state)
+            if on_token is None:
+                result = await self.graph.ainvoke(initial_state)
+            else:
+                result = initial_state
+                async for mode, chunk in self.graph.astream(
+                    initial_state, stream_mode=["custom", "values"]
+                ):
+                    if mode == "custom":
+                        if "token" in chunk:
+                            await on_token(chunk["token"])
+                        elif on_reply_start is not None:
+                            await on_reply_start()
+                    else:
+                        result = chunk
 
             # Extract the final AI response
             final_messages = result.get("messages", [])
@@ -456,10 +591,20 @@ Always explain what you're doing and ask for user confirmation before creating f
                 "success": False,
             }
 
+    def chat(
+        self,
+        user_message: str,
+        conversation_history: Optional[List[BaseMessage]] = None,
+        user_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Synchronous wrapper around chat_async for callers without an event loop."""
+        return asyncio.run(self.chat_async(user_message, conversation_history, user_id))
+
     def reinit_with_model(self, model: str):
         """Reinitialize the chatbot with a new model."""
-        self.llm = ChatOpenAI(api_key=self.api_key, model=model)
-        self.tools = self._create_tools()
-        self.llm_with_tools = self.llm.bind_tools(self.tools)
-        self.graph = self._build_chatbot_graph()
+        # The graph nodes read self.llm_with_tools on every call, so the tools
+        # and the compiled graph are kept and only the LLM is replaced
+        self.llm_with_tools = _get_bound_llm(self.api_key.get_secret_value(), model)
+        self.llm = self.llm_with_tools.bound
+        self.default_model = model
         logger.info(f"Reinitialized chatbot with model: {model}")
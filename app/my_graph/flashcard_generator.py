@@ -25,6 +25,14 @@ class FlashcardGenerator:
         self.verb_generator = VerbGenerator()
         self.pronoun_generator = PronounGenerator()
         self.number_generator = NumberGenerator()
+        # Generator for each grammar model, looked up by the object's exact type
+        self._generators = {
+            Noun: self.noun_generator,
+            Adjective: self.adjective_generator,
+            Verb: self.verb_generator,
+            Pronoun: self.pronoun_generator,
+            Number: self.number_generator,
+        }
 
     def generate_flashcards_from_grammar(
         self,
@@ -47,28 +55,13 @@ class FlashcardGenerator:
         flashcards = []
 
         try:
-            if isinstance(grammar_obj, Noun):
-                flashcards = self.noun_generator.generate_flashcards_from_grammar(
-                    grammar_obj, word_type, generated_sentences, user_id
-                )
-            elif isinstance(grammar_obj, Adjective):
-                flashcards = self.adjective_generator.generate_flashcards_from_grammar(
-                    grammar_obj, word_type, generated_sentences, user_id
-                )
-            elif isinstance(grammar_obj, Verb):
-                flashcards = self.verb_generator.generate_flashcards_from_grammar(
-                    grammar_obj, word_type, generated_sentences, user_id
-                )
-            elif isinstance(grammar_obj, Pronoun):
-                flashcards = self.pronoun_generator.generate_flashcards_from_grammar(
-                    grammar_obj, word_type, generated_sentences, user_id
-                )
-            elif isinstance(grammar_obj, Number):
-                flashcards = self.number_generator.generate_flashcards_from_grammar(
+            generator = self._generators.get(type(grammar_obj))
+            if generator is None:
+                logger.warning(f"Unknown grammar object type: {type(grammar_obj)}")
+            else:
+                flashcards = generator.generate_flashcards_from_grammar(
                     grammar_obj, word_type, generated_sentences, user_id
                 )
-            else:
-                logger.warning(f"Unknown grammar object type: {type(grammar_obj)}")
 
         except Exception as e:
             logger.error(f"Error generating flashcards: {e}")
@@ -87,20 +80,19 @@ class FlashcardGenerator:
         """
         saved_count = 0
 
+        # Set user_id on the flashcards
         for flashcard in flashcards:
-            try:
-                # Set user_id on the flashcard
-                flashcard.user_id = user_id
-                
-                flashcard_id = self.service.db.add_flashcard(flashcard)
-                if flashcard_id:
-                    saved_count += 1
-                    logger.info(f"Saved flashcard: {flashcard.title}")
-                else:
-                    logger.warning(f"Failed to save flashcard: {flashcard.title}")
-
-            except Exception as e:
-                logger.error(f"Error saving flashcard '{flashcard.title}': {e}")
+            flashcard.user_id = user_id
+
+        # Insert all cards in one round trip
+        flashcard_ids = self.service.db.add_flashcards_bulk(flashcards)
+
+        for flashcard, flashcard_id in zip(flashcards, flashcard_ids):
+            if flashcard_id:
+                saved_count += 1
+                logger.info(f"Saved flashcard: {flashcard.title}")
+            else:
+                logger.warning(f"Failed to save flashcard: {flashcard.title}")
 
         logger.info(f"Successfully saved {saved_count}/{len(flashcards)} flashcards")
         return saved_count
@@ -0,0 +1,40 @@
+"""Output parsers for structured LLM responses."""
+
+from typing import List, Optional
+
+from pydantic import ValidationError
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import Generation
+from langchain_core.utils.pydantic import TBaseModel
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a surrounding ```json ... ``` fence from an LLM response."""
+    text = text.strip()
+    if text.startswith("```") and text.endswith("```"):
+        first_newline = text.find("\n")
+        if first_newline != -1:
+            return text[first_newline + 1 : -3].strip()
+    return text
+
+
+class PydanticJsonOutputParser(PydanticOutputParser[TBaseModel]):
+    """PydanticOutputParser that validates the raw JSON text in a single pass.
+
+    The stock parser decodes the response into a Python dict and then runs
+    model_validate over it. Here the text goes straight to pydantic-core via
+    model_validate_json. Responses that are not plain JSON (partial output,
+    prose around the object) fall back to the stock parser.
+    """
+
+    def parse_result(
+        self, result: List[Generation], *, partial: bool = False
+    ) -> Optional[TBaseModel]:
+        if not partial:
+            try:
+                return self.pydantic_object.model_validate_json(
+                    _strip_code_fence(result[0].text)
+                )
+            except ValidationError:
+                pass
+        return super().parse_result(result, partial=partial)
@@ -1,21 +1,60 @@
 """Flashcard generation tool implementation."""
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Union, List
 
-from app.grammar.russian import (
-    Noun,
-    Adjective,
-    Verb,
-    Pronoun,
-    Number,
-)
+from app.grammar.russian import GRAMMAR_MODELS
 from app.my_graph.flashcard_generator import flashcard_generator
+from app.my_graph.tools.grammar_analysis import analyze_russian_grammar_impl
 from app.flashcards import flashcard_service
 from app.flashcards.models import WordType
 
 logger = logging.getLogger(__name__)
 
+# Grammar result key -> (word type, model), in the order the keys are checked
+_GRAMMAR_DISPATCH = {
+    f"{word_type}_grammar": (word_type, model)
+    for word_type, model in GRAMMAR_MODELS.items()
+}
+
+# Words of one multi-word call generated at once. Each word waits on the LLM
+# and the database, so they share a pool instead of running one by one.
+MAX_PARALLEL_WORDS = 4
+
+# Set in the pool's threads, so a nested list is generated in place rather
+# than waiting on the pool from inside it
+_pool_thread = threading.local()
+
+
+def _mark_pool_thread() -> None:
+    _pool_thread.active = True
+
+
+_word_pool = ThreadPoolExecutor(
+    max_workers=MAX_PARALLEL_WORDS,
+    thread_name_prefix="flashcard-words",
+    initializer=_mark_pool_thread,
+)
+
+
+def _generate_for_each(
+    analysis_list: List[Any],
+    focus_areas: Optional[List[str]],
+    user_id: int,
+) -> List[Dict[str, Any]]:
+    """Generate flashcards for each analysis of a list, in parallel."""
+
+    def generate(single_analysis: Any) -> Dict[str, Any]:
+        return generate_flashcards_from_analysis_impl(
+            single_analysis, focus_areas, None, user_id
+        )
+
+    if getattr(_pool_thread, "active", False):
+        return list(map(generate, analysis_list))
+    return list(_word_pool.map(generate, analysis_list))
+
 
 def generate_flashcards_from_analysis_impl(
     analysis_data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
@@ -41,10 +80,9 @@ def generate_flashcards_from_analysis_impl(
                 total_flashcards = 0
                 combined_word_types = []
 
-                for single_analysis in analysis_data:
-                    result = generate_flashcards_from_analysis_impl(
-                        single_analysis, focus_areas, None, user_id
-                    )
+                results = _generate_for_each(analysis_data, focus_areas, user_id)
+
+                for result in results:
                     if result.get("success"):
                         total_flashcards += result.get("flashcards_generated", 0)
                         if result.get("word_type"):
@@ -61,8 +99,6 @@ def generate_flashcards_from_analysis_impl(
 
         # If no analysis_data provided but word is given, analyze the word first
         if not analysis_data and word:
-            from app.my_graph.tools.grammar_analysis import analyze_russian_grammar_impl
-            
             analysis_result = analyze_russian_grammar_impl(word)
             if analysis_result.get("success"):
                 analysis_data = analysis_result
@@ -71,16 +107,7 @@ def generate_flashcards_from_analysis_impl(
         grammar_result = None
         if analysis_data and "analysis" in analysis_data:
             grammar_result = analysis_data["analysis"]
-        elif analysis_data and any(
-            key in analysis_data
-            for key in [
-                "noun_grammar",
-                "adjective_grammar",
-                "verb_grammar",
-                "pronoun_grammar",
-                "number_grammar",
-            ]
-        ):
+        elif analysis_data and any(key in analysis_data for key in _GRAMMAR_DISPATCH):
             # analysis_data might be the grammar_result itself
             grammar_result = analysis_data
 
@@ -90,48 +117,16 @@ def generate_flashcards_from_analysis_impl(
             word_type = None
             grammar_obj = None
 
-            if grammar_result.get("noun_grammar"):
-                grammar_data = grammar_result["noun_grammar"]
-                word_type = "noun"
-                # Convert dict back to Pydantic model if needed
-                if isinstance(grammar_data, dict):
-                    grammar_obj = Noun(**grammar_data)
-                else:
-                    grammar_obj = grammar_data
-            elif grammar_result.get("adjective_grammar"):
-                grammar_data = grammar_result["adjective_grammar"]
-                word_type = "adjective"
-                # Convert dict back to Pydantic model if needed
-                if isinstance(grammar_data, dict):
-                    grammar_obj = Adjective(**grammar_data)
-                else:
-                    grammar_obj = grammar_data
-            elif grammar_result.get("verb_grammar"):
-                grammar_data = grammar_result["verb_grammar"]
-                word_type = "verb"
-                # Convert dict back to Pydantic model if needed
-                if isinstance(grammar_data, dict):
-                    grammar_obj = Verb(**grammar_data)
-                else:
-                    grammar_obj = grammar_data
-            elif grammar_result.get("pronoun_grammar"):
-                grammar_data = grammar_result["pronoun_grammar"]
-                word_type = "pronoun"
-                # Convert dict back to Pydantic model if needed
-                if isinstance(grammar_data, dict):
-                    grammar_obj = Pronoun(**grammar_data)
-                else:
-                    grammar_obj = grammar_data
-            elif grammar_result.get("number_grammar"):
-                grammar_data = grammar_result["number_grammar"]
-                word_type = "number"
-                # Convert dict back to Pydantic model if needed
-                if isinstance(grammar_data, dict):
-                    from app.grammar.russian import Number as NumberClass
-
-                    grammar_obj = NumberClass(**grammar_data)
-                else:
-                    grammar_obj = grammar_data
+            for key, (grammar_type, model) in _GRAMMAR_DISPATCH.items():
+                grammar_data = grammar_result.get(key)
+                if grammar_data:
+                    word_type = grammar_type
+                    # Convert dict back to Pydantic model if needed
+                    if isinstance(grammar_data, dict):
+                        grammar_obj = model.model_validate(grammar_data)
+                    else:
+                        grammar_obj = grammar_data
+                    break
 
             if grammar_obj and word_type:
                 # Generate flashcards
@@ -212,4 +207,4 @@ def generate_flashcards_from_analysis_impl(
 
     except Exception as e:
         logger.error(f"Error generating flashcards: {e}")
-        return {"flashcards_generated": 0, "error": str(e), "success": False}
\ No newline at end of file
+        return {"flashcards_generated": 0, "error": str(e), "success": False}
@@ -1,46 +1,73 @@
 """Grammar analysis tool implementation."""
 
+import copy
 import logging
+import threading
+from collections import OrderedDict
 from typing import Dict, Any
 
-from pydantic import SecretStr
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_openai import ChatOpenAI
-
 from app.config import settings
-from app.my_graph.prompts import (
-    initial_classification_prompt,
-    get_noun_grammar_prompt,
-    get_adjective_grammar_prompt,
-    get_verb_grammar_prompt,
-    get_pronoun_grammar_prompt,
-    get_number_grammar_prompt,
-)
-from app.grammar.russian import (
-    WordClassification,
-    Noun,
-    Adjective,
-    Verb,
-    Pronoun,
-    Number,
-)
+from app.my_graph.utils import get_llm
+from app.my_graph.output_parsers import PydanticJsonOutputParser
+from app.my_graph import prompts
+from app.my_graph.prompts import initial_classification_prompt
+from app.grammar.russian import WordClassification, GRAMMAR_MODELS
 
 logger = logging.getLogger(__name__)
 
+ANALYSIS_CACHE_SIZE = 4096
+
+# Successful analyses by normalized word, so a word asked about again skips
+# both LLM round trips; least recently used words are evicted first. This is
+# the only analysis cache, shared by the chatbot, flashcard generation and
+# bulk jobs. The tool runs in worker threads, so the cache is guarded by a
+# lock. Callers get their own copies, so they cannot change cached entries.
+_analysis_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+# Word type -> prompt for its detailed grammar, for every supported word type
+_GRAMMAR_PROMPTS = {
+    word_type: getattr(prompts, f"get_{word_type}_grammar_prompt")
+    for word_type in GRAMMAR_MODELS
+}
+
 
 def analyze_russian_grammar_impl(russian_word: str) -> Dict[str, Any]:
     """Implementation for grammar analysis tool."""
+    word_key = russian_word.strip().lower()
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(word_key)
+        if cached is not None:
+            _analysis_cache.move_to_end(word_key)
+    if cached is not None:
+        # The entry may come from another spelling of the word (case,
+        # whitespace), so it reports this caller's input
+        result = copy.deepcopy(cached)
+        result["word"] = russian_word
+        result["analysis"]["original_human_input"] = russian_word
+        return result
+
+    result = _analyze(russian_word)
+    if result["success"]:
+        cached = copy.deepcopy(result)
+        with _analysis_cache_lock:
+            _analysis_cache[word_key] = cached
+            if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
+    return result
+
+
+def _analyze(russian_word: str) -> Dict[str, Any]:
+    """Classify a word and get its detailed grammar from the LLM."""
     try:
-        # Create LLM instance
-        llm = ChatOpenAI(
-            api_key=SecretStr(settings.openai_api_key), model=settings.llm_model
-        )
+        # Reuse the LLM client across calls
+        llm = get_llm(settings.openai_api_key, settings.llm_model)
 
         # Step 1: Classify the word
         classification_chain = (
             initial_classification_prompt
             | llm
-            | PydanticOutputParser(pydantic_object=WordClassification)
+            | PydanticJsonOutputParser(pydantic_object=WordClassification)
         )
 
         classification: WordClassification = classification_chain.invoke(
@@ -62,66 +89,10 @@ def analyze_russian_grammar_impl(russian_word: str) -> Dict[str, Any]:
         word_type = classification.word_type
         russian_form = classification.russian_word
 
-        if word_type == "noun":
-            noun_chain = (
-                get_noun_grammar_prompt
-                | llm
-                | PydanticOutputParser(pydantic_object=Noun)
-            )
-            noun_grammar = noun_chain.invoke({"word": russian_form})
-            result["noun_grammar"] = noun_grammar
-            result["final_answer"] = noun_grammar.model_dump_json(indent=2)
-
-        elif word_type == "adjective":
-            adjective_chain = (
-                get_adjective_grammar_prompt
-                | llm
-                | PydanticOutputParser(pydantic_object=Adjective)
-            )
-            adjective_grammar = adjective_chain.invoke({"word": russian_form})
-            result["adjective_grammar"] = adjective_grammar
-            result["final_answer"] = adjective_grammar.model_dump_json(indent=2)
-
-        elif word_type == "verb":
-            verb_chain = (
-                get_verb_grammar_prompt
-                | llm
-                | PydanticOutputParser(pydantic_object=Verb)
-            )
-            verb_grammar = verb_chain.invoke({"word": russian_form})
-            result["verb_grammar"] = verb_grammar
-            result["final_answer"] = verb_grammar.model_dump_json(indent=2)
-
-        elif word_type == "pronoun":
-            pronoun_chain = (
-                get_pronoun_grammar_prompt
-                | llm
-                | PydanticOutputParser(pydantic_object=Pronoun)
-            )
-            pronoun_grammar = pronoun_chain.invoke({"word": russian_form})
-            result["pronoun_grammar"] = pronoun_grammar
-            result["final_answer"] = pronoun_grammar.model_dump_json(indent=2)
-
-        elif word_type == "number":
-            number_chain = (
-                get_number_grammar_prompt
-                | llm
-                | PydanticOutputParser(pydantic_object=Number)
-            )
-            number_grammar = number_chain.invoke({"word": russian_form})
-            result["number_grammar"] = number_grammar
-            result["final_answer"] = number_grammar.model_dump_json(indent=2)
-
-        # Check if we got a classification but no detailed grammar (e.g., unsupported word type like adverb)
-        if not any(
-            [
-                result.get("noun_grammar"),
-                result.get("adjective_grammar"),
-                result.get("verb_grammar"),
-                result.get("pronoun_grammar"),
-                result.get("number_grammar"),
-            ]
-        ):
+        grammar_prompt = _GRAMMAR_PROMPTS.get(word_type)
+        if grammar_prompt is None:
+            # Classified, but detailed grammar is not supported for this word
+            # type (e.g. adverb), so every *_grammar entry stays None
             return {
                 "word": russian_word,
                 "analysis": result,
@@ -130,8 +101,17 @@ def analyze_russian_grammar_impl(russian_word: str) -> Dict[str, Any]:
                 "success": True,
             }
 
+        grammar_chain = (
+            grammar_prompt
+            | llm
+            | PydanticJsonOutputParser(pydantic_object=GRAMMAR_MODELS[word_type])
+        )
+        grammar = grammar_chain.invoke({"word": russian_form})
+        result[f"{word_type}_grammar"] = grammar
+        result["final_answer"] = grammar.model_dump_json(indent=2)
+
         return {"word": russian_word, "analysis": result, "success": True}
 
     except Exception as e:
         logger.error(f"Error in grammar analysis tool: {e}")
-        return {"word": russian_word, "error": str(e), "success": False}
\ No newline at end of file
+        return {"word": russian_word, "error": str(e), "success": False}
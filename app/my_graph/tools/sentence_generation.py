@@ -1,6 +1,8 @@
 """Sentence generation tool implementation."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, Any, Optional
 
 from app.my_graph.sentence_generation import LLMSentenceGenerator
@@ -15,19 +17,28 @@ def generate_example_sentences_impl(
     try:
         sentence_generator = LLMSentenceGenerator()
 
-        examples = []
-
-        # Generate 2-3 example sentences
-        for i in range(3):
-            if theme:
-                sentence = sentence_generator.generate_contextual_sentence(
-                    word, word, grammatical_context, theme
-                )
-            else:
-                sentence = sentence_generator.generate_example_sentence(
-                    word, word, grammatical_context, "word"
-                )
-            examples.append(sentence)
+        if theme:
+            generate = partial(
+                sentence_generator.generate_contextual_sentence,
+                word,
+                word,
+                grammatical_context,
+                theme,
+            )
+        else:
+            generate = partial(
+                sentence_generator.generate_example_sentence,
+                word,
+                word,
+                grammatical_context,
+                "word",
+            )
+
+        # Generate 3 example sentences; each is its own LLM call, so run them
+        # in parallel instead of waiting for one after the other
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(generate) for _ in range(3)]
+            examples = [future.result() for future in futures]
 
         return {
             "word": word,
@@ -39,4 +50,4 @@ def generate_example_sentences_impl(
 
     except Exception as e:
         logger.error(f"Error generating example sentences: {e}")
-        return {"word": word, "error": str(e), "success": False}
\ No newline at end of file
+        return {"word": word, "error": str(e), "success": False}
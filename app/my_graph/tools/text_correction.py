@@ -1,27 +1,18 @@
 """Text correction tool implementation."""
 
-import json
 import logging
 from typing import Dict, Any
 
-from pydantic import SecretStr
+import orjson
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
 
 from app.config import settings
+from app.my_graph.utils import get_llm
 
 logger = logging.getLogger(__name__)
 
-
-def correct_multilingual_mistakes_impl(mixed_text: str) -> Dict[str, Any]:
-    """Implementation for correction tool."""
-    try:
-        # Create LLM instance
-        llm = ChatOpenAI(
-            api_key=SecretStr(settings.openai_api_key), model=settings.llm_model
-        )
-
-        correction_prompt = f"""Please analyze and correct this text that is intended to be Russian but may contain foreign words or grammatical mistakes:
+# Formatted with str.format, so literal braces are doubled
+CORRECTION_PROMPT_TEMPLATE = """Please analyze and correct this text that is intended to be Russian but may contain foreign words or grammatical mistakes:
 
 Text: "{mixed_text}"
 
@@ -47,23 +38,38 @@ Focus on:
 4. Fixing word order if needed
 """
 
+
+def correct_multilingual_mistakes_impl(mixed_text: str) -> Dict[str, Any]:
+    """Implementation for correction tool."""
+    try:
+        # Reuse the LLM client across calls
+        llm = get_llm(settings.openai_api_key, settings.llm_model, deterministic=True)
+
+        correction_prompt = CORRECTION_PROMPT_TEMPLATE.format(
+            mixed_text=mixed_text.strip()
+        )
+
         response = llm.invoke([HumanMessage(content=correction_prompt)])
 
-        # Try to parse JSON response
-        try:
-            result = json.loads(response.content)
-            result["success"] = True
-            return result
-        except json.JSONDecodeError:
-            # Fallback if JSON parsing fails
-            return {
-                "original": mixed_text,
-                "corrected": response.content,
-                "mistakes": [],
-                "overall_explanation": "Correction provided but couldn't parse detailed breakdown",
-                "success": True,
-            }
+        # Only a response that ends like a JSON object can parse, so prose
+        # and truncated output skip straight to the fallback
+        if response.content.rstrip().endswith("}"):
+            try:
+                result = orjson.loads(response.content)
+                result["success"] = True
+                return result
+            except orjson.JSONDecodeError:
+                pass
+
+        # Fallback if JSON parsing fails
+        return {
+            "original": mixed_text,
+            "corrected": response.content,
+            "mistakes": [],
+            "overall_explanation": "Correction provided but couldn't parse detailed breakdown",
+            "success": True,
+        }
 
     except Exception as e:
         logger.error(f"Error in correction tool: {e}")
-        return {"original": mixed_text, "error": str(e), "success": False}
\ No newline at end of file
+        return {"original": mixed_text, "error": str(e), "success": False}
@@ -3,28 +3,29 @@
 import logging
 from typing import Dict, Any
 
-from pydantic import SecretStr
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
 
 from app.config import settings
+from app.my_graph.utils import get_llm
 
 logger = logging.getLogger(__name__)
 
+TRANSLATION_PROMPT_TEMPLATE = """Translate the following {from_lang} text to {to_lang}:
+
+Text: "{text}"
+
+Provide a natural, contextually appropriate translation. If the text contains grammar learning content, include brief notes about any important grammatical considerations."""
+
 
 def translate_phrase_impl(text: str, from_lang: str, to_lang: str) -> Dict[str, Any]:
     """Implementation for translation tool."""
     try:
-        # Create LLM instance
-        llm = ChatOpenAI(
-            api_key=SecretStr(settings.openai_api_key), model=settings.llm_model
-        )
+        # Reuse the LLM client across calls
+        llm = get_llm(settings.openai_api_key, settings.llm_model, deterministic=True)
 
-        translation_prompt = f"""Translate the following {from_lang} text to {to_lang}:
-
-Text: "{text}"
-
-Provide a natural, contextually appropriate translation. If the text contains grammar learning content, include brief notes about any important grammatical considerations."""
+        translation_prompt = TRANSLATION_PROMPT_TEMPLATE.format(
+            text=text.strip(), from_lang=from_lang, to_lang=to_lang
+        )
 
         response = llm.invoke([HumanMessage(content=translation_prompt)])
 
@@ -38,4 +39,4 @@ Provide a natural, contextually appropriate translation. If the text contains gr
 
     except Exception as e:
         logger.error(f"Error in translation tool: {e}")
-        return {"original": text, "error": str(e), "success": False}
\ No newline at end of file
+        return {"original": text, "error": str(e), "success": False}
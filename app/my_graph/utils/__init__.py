@@ -1,6 +1,7 @@
-"""Utilities for flashcard generation."""
+"""Utilities for flashcard generation and the graph tools."""
 
 from .suffix_extractor import SuffixExtractor
 from .form_analyzer import FormAnalyzer
+from .llm import get_llm
 
-__all__ = ["SuffixExtractor", "FormAnalyzer"]
+__all__ = ["SuffixExtractor", "FormAnalyzer", "get_llm"]
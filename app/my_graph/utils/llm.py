@@ -0,0 +1,28 @@
+"""Shared LLM clients for the graph tools."""
+
+from functools import lru_cache
+
+from pydantic import SecretStr
+from langchain_core.caches import InMemoryCache
+from langchain_openai import ChatOpenAI
+
+# Replies of the deterministic clients. Entries are keyed by prompt and model
+# settings, so the tools sharing it never get each other's answers.
+response_cache = InMemoryCache(maxsize=2048)
+
+
+@lru_cache(maxsize=16)
+def get_llm(api_key: str, model: str, deterministic: bool = False) -> ChatOpenAI:
+    """Get a shared LLM client for the given API key and model.
+
+    Deterministic clients run at temperature 0, so repeated prompts are
+    answered from response_cache instead of another round trip to OpenAI.
+    """
+    if not deterministic:
+        return ChatOpenAI(api_key=SecretStr(api_key), model=model)
+    return ChatOpenAI(
+        api_key=SecretStr(api_key),
+        model=model,
+        temperature=0,
+        cache=response_cache,
+    )
@@ -20,6 +20,7 @@ from app.my_telegram.handlers import (
     handle_message,
 )
 from app.my_telegram.handlers.chatbot_handlers import set_chatbot_tutor
+from app.my_telegram.update_processor import PerUserUpdateProcessor
 from app.config import settings
 from pydantic import SecretStr
 
@@ -893,8 +894,13 @@ def init_application(token: str) -> Application:
     except Exception as e:
         logger.warning(f"Could not load user's configured model on startup: {e}")
 
-    # Create the Application
-    application = Application.builder().token(token).build()
+    # Create the Application, answering different users concurrently
+    application = (
+        Application.builder()
+        .token(token)
+        .concurrent_updates(PerUserUpdateProcessor(settings.update_concurrency))
+        .build()
+    )
 
     # Add command handlers
     application.add_handler(CommandHandler("start", start))
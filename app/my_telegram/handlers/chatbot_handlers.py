@@ -8,7 +8,7 @@ from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from app.my_telegram.session import session_manager
 from app.my_telegram.session.config_manager import config_manager
 from app.my_graph.chatbot_tutor import ConversationalRussianTutor
-from app.common.telegram_utils import safe_send_markdown
+from app.common.telegram_utils import safe_send_markdown, StreamingReply
 from .learning_handlers import process_answer
 from app.config import settings
 from pydantic import SecretStr
@@ -41,11 +41,15 @@ def get_user_chatbot(user_id: int) -> ConversationalRussianTutor:
         current_model = existing_chatbot.default_model
         current_api_key = existing_chatbot.api_key.get_secret_value()
         
-        if current_api_key != api_key or current_model != model:
+        if current_api_key != api_key:
             logger.info(f"Updating chatbot for user {user_id} with model: {model}")
             user_chatbots[user_id] = ConversationalRussianTutor(
                 api_key=SecretStr(api_key), model=model
             )
+        elif current_model != model:
+            # Only the LLM depends on the model; keep the tools and graph
+            logger.info(f"Switching chatbot for user {user_id} to model: {model}")
+            existing_chatbot.reinit_with_model(model)
     
     return user_chatbots[user_id]
 
@@ -138,38 +142,40 @@ async def process_chatbot_conversation(
         # Get conversation history from session
         conversation_history = session.get_conversation_history()
 
-        # Process message through chatbot
-        result = chatbot_tutor.chat(user_text, conversation_history, user_id)
+        # Process message through chatbot, showing the reply as it is generated
+        reply = StreamingReply(update.message)
+        result = await chatbot_tutor.chat_async(
+            user_text,
+            conversation_history,
+            user_id,
+            on_token=reply.add,
+            on_reply_start=reply.reset,
+        )
 
         if result.get("success"):
             response = result.get("response", "I'm not sure how to respond to that.")
             updated_messages = result.get("messages", [])
 
-            # Update conversation history in session
-            # Only store the new messages (excluding system message)
+            # The result holds the trimmed history plus this turn, so it
+            # replaces the session history (excluding the system message)
             if updated_messages:
-                # Filter out system messages and store only human/AI messages
-                for msg in updated_messages:
-                    if not isinstance(msg, SystemMessage):
-                        session.add_message_to_history(msg)
+                session.set_conversation_history(
+                    msg for msg in updated_messages if not isinstance(msg, SystemMessage)
+                )
 
             # Send response
             if response:
-                # Try markdown first, fallback to plain text
-                try:
-                    await update.message.reply_text(response, parse_mode="Markdown")
-                except Exception:
-                    # Fallback to plain text
-                    await update.message.reply_text(response)
+                await reply.finish(response)
             else:
-                await update.message.reply_text(
+                await reply.finish(
                     "I processed your message but don't have a response ready."
                 )
 
         else:
             error_msg = result.get("error", "Unknown error occurred")
             logger.error(f"Chatbot error for user {user_id}: {error_msg}")
-            await update.message.reply_text(
+            # Replace any partial draft, so it isn't left looking like a reply
+            await reply.finish(
                 "❌ I encountered an error processing your message. Please try again."
             )
 
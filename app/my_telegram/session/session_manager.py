@@ -28,7 +28,7 @@ class UserSession:
     regenerating_mode: bool = False
     regenerating_flashcard_id: Optional[str] = None
 
-    # Chatbot conversation history (last 20 messages)
+    # Chatbot conversation history, trimmed by the chatbot on each turn
     conversation_history: list = field(default_factory=list)
 
     def clear_learning_state(self):
@@ -64,6 +64,10 @@ class UserSession:
         if len(self.conversation_history) > 20:
             self.conversation_history = self.conversation_history[-20:]
 
+    def set_conversation_history(self, messages):
+        """Replace conversation history with the given messages."""
+        self.conversation_history = list(messages)
+
     def clear_conversation_history(self):
         """Clear conversation history."""
         self.conversation_history = []
@@ -0,0 +1,65 @@
+"""Update processing that runs different users' updates concurrently."""
+
+import logging
+from collections import deque
+from typing import Any, Awaitable, Deque, Dict
+
+from telegram.ext import BaseUpdateProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class PerUserUpdateProcessor(BaseUpdateProcessor):
+    """Processes updates of different users concurrently, one at a time per user.
+
+    A chatbot turn waits seconds on the LLM, so processing every update in
+    turn would make each user wait for everyone else's replies. Updates of
+    the same user still run in order, as they share the user's session.
+    """
+
+    def __init__(self, max_concurrent_updates: int):
+        super().__init__(max_concurrent_updates)
+        # Updates of each user with one in progress, oldest (running) first
+        self._user_queues: Dict[int, Deque[Awaitable[Any]]] = {}
+
+    async def do_process_update(
+        self, update: object, coroutine: Awaitable[Any]
+    ) -> None:
+        """Await the coroutine, after the user's earlier updates are done.
+
+        PTB takes a concurrency slot before calling this, so an update of a
+        user who already has one in progress is handed to that update and
+        returns at once. Waiting updates hold no slot, and a burst from one
+        user never takes more than one slot from everyone else.
+        """
+        user = getattr(update, "effective_user", None)
+        if user is None:
+            await coroutine
+            return
+
+        queue = self._user_queues.get(user.id)
+        if queue is not None:
+            queue.append(coroutine)
+            return
+
+        queue = self._user_queues[user.id] = deque([coroutine])
+        try:
+            while queue:
+                try:
+                    await queue[0]
+                except Exception as e:
+                    # Keep going so the user's later updates still run
+                    logger.error(f"Error processing update for user {user.id}: {e}")
+                queue.popleft()
+        finally:
+            del self._user_queues[user.id]
+            # Only reached with updates left if this task was cancelled
+            for pending in queue:
+                if hasattr(pending, "close"):
+                    pending.close()
+
+    async def initialize(self) -> None:
+        """Nothing to set up."""
+
+    async def shutdown(self) -> None:
+        """Nothing to clean up."""
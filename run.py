@@ -7,7 +7,6 @@ Make sure your PYTHONPATH includes the project root directory.
 
 import sys
 import os
-import threading
 
 # Add the project root to the Python path if needed
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -15,14 +14,9 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 # Import after setting the path
-from app.main import run_fastapi, start_bot
+from app.main import main
 
 if __name__ == "__main__":
-    # Start FastAPI server in background thread
-    thread = threading.Thread(target=run_fastapi, daemon=True)
-    thread.start()
-    print("FastAPI server started in background")
-
-    # Run the Telegram bot in the main thread
-    print("Starting Telegram bot...")
-    start_bot()
+    # Run the FastAPI server and the Telegram bot on one event loop
+    print("Starting FastAPI server and Telegram bot...")
+    main()
@@ -0,0 +1,39 @@
+"""Tests for the flashcard question formatter."""
+
+from app.flashcards.formatters.question_formatter import QuestionFormatter
+from app.flashcards.models import FillInTheBlank
+
+
+def make_card(text):
+    """Create a fill-in-the-blank card with the given text."""
+    return FillInTheBlank(user_id=1, text_with_blanks=text, answers=["а"], id="card_1")
+
+
+class TestQuestionFormatter:
+    """Test cases for QuestionFormatter."""
+
+    def test_fill_in_blank_question_is_escaped(self):
+        """Test that the question is shown with blanks and markdown escaped."""
+        text, _ = QuestionFormatter().format_question_for_bot(
+            make_card("Я вижу {blank} *дом*")
+        )
+
+        assert "Я вижу \\_\\_\\_\\_\\_" in text
+        assert "\\*дом\\*" in text
+
+    def test_fill_in_blank_question_follows_edits_and_copies(self):
+        """Test that edited and copied cards are never shown with an old question."""
+        formatter = QuestionFormatter()
+        card = make_card("Я вижу {blank} дом")
+        formatter.format_question_for_bot(card)
+
+        copy, _ = formatter.format_question_for_bot(
+            card.model_copy(update={"text_with_blanks": "Это {blank} кот"})
+        )
+        card.text_with_blanks = "Там {blank} сад"
+        edited, _ = formatter.format_question_for_bot(card)
+        original, _ = formatter.format_question_for_bot(make_card("Я вижу {blank} дом"))
+
+        assert "Это" in copy and "дом" not in copy
+        assert "Там" in edited and "дом" not in edited
+        assert "Я вижу" in original
@@ -0,0 +1 @@
+"""Tests for grammar module."""
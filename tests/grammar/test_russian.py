@@ -0,0 +1,71 @@
+"""Tests for Russian grammar models."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.grammar.russian import (
+    Adjective,
+    Noun,
+    Number,
+    Pronoun,
+    Verb,
+    WordClassification,
+)
+
+
+class TestGrammarModels:
+    """Test cases for the grammar schema models."""
+
+    def test_case_forms_reject_unknown_case(self):
+        """Test that case-form dicts only accept the six case keys."""
+        with pytest.raises(ValidationError):
+            Pronoun(
+                dictionary_form="я",
+                english_translation="I",
+                singular={"nom": "я", "voc": "я"},
+            )
+
+    def test_case_forms_share_one_schema_definition(self):
+        """Test that all case-form fields reference a single schema definition."""
+        schema = Pronoun.model_json_schema()
+
+        assert list(schema["$defs"]) == ["CaseForms"]
+
+    @pytest.mark.parametrize(
+        "model", [WordClassification, Noun, Adjective, Verb, Pronoun, Number]
+    )
+    def test_format_instructions_cover_model_fields(self, model):
+        """Test that the hand-written format instructions list every field."""
+        instructions = model.get_format_instructions()
+
+        missing = [
+            name for name in model.model_fields if f'"{name}"' not in instructions
+        ]
+
+        # Number.compound_forms is not requested from the LLM
+        if model is Number:
+            missing.remove("compound_forms")
+
+        assert missing == []
+
+    def test_grammar_models_are_frozen(self):
+        """Test that parsed grammar cannot be mutated in place."""
+        classification = WordClassification(
+            word_type="noun", russian_word="дом", original_word="house"
+        )
+
+        with pytest.raises(ValidationError):
+            classification.word_type = "verb"
+
+    def test_unknown_fields_are_ignored(self):
+        """Test that extra keys from the LLM are dropped."""
+        classification = WordClassification.model_validate(
+            {
+                "word_type": "noun",
+                "russian_word": "дом",
+                "original_word": "house",
+                "confidence": 0.9,
+            }
+        )
+
+        assert "confidence" not in classification.model_dump()
@@ -0,0 +1,276 @@
+"""Tests for the bulk text processor."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.my_graph.bulk_text_processor import BulkProcessingJob, BulkTextProcessor
+from app.my_graph.tools import grammar_analysis
+
+
+class TestBulkTextProcessor:
+    """Test cases for BulkTextProcessor."""
+
+    def test_extract_russian_words(self):
+        """Test that words are lowercased, deduplicated and kept in order."""
+        processor = BulkTextProcessor()
+
+        words = processor.extract_russian_words(
+            "Мама мыла раму. Hello! МАМА и кот-учёный, объявление; Ёлка, ёлка"
+        )
+
+        assert words == ["мама", "мыла", "раму", "кот-учёный", "объявление", "ёлка"]
+
+    @pytest.mark.asyncio
+    async def test_start_from_worker_thread_runs_on_bound_loop(self):
+        """Test that jobs started off the loop are scheduled on the bound loop."""
+        processor = BulkTextProcessor()
+        processor.bind_loop(asyncio.get_running_loop())
+
+        with patch(
+            "app.my_graph.bulk_text_processor.analyze_russian_grammar_impl",
+            return_value={"success": False, "error": "test"},
+        ):
+            job_id = await asyncio.to_thread(
+                processor.start_bulk_processing, "Привет мир", 1
+            )
+
+            for _ in range(100):
+                if job_id in processor.completed_jobs:
+                    break
+                await asyncio.sleep(0.01)
+
+        status = processor.get_job_status(job_id)
+        assert status["status"] == "completed"
+        assert status["processed_words"] == 2
+
+    @pytest.mark.asyncio
+    async def test_words_are_processed_concurrently(self):
+        """Test that several words are analyzed at the same time."""
+        processor = BulkTextProcessor()
+        # Each analysis waits for the other two, so this only finishes if all
+        # three words are in flight together
+        barrier = threading.Barrier(3, timeout=5)
+
+        def analyze(word):
+            barrier.wait()
+            return {"success": True, "analysis": {}}
+
+        with patch(
+            "app.my_graph.bulk_text_processor.analyze_russian_grammar_impl",
+            side_effect=analyze,
+        ), patch(
+            "app.my_graph.bulk_text_processor.generate_flashcards_from_analysis_impl",
+            return_value={
+                "success": True,
+                "flashcards_generated": 2,
+                "word_type": "noun",
+            },
+        ) as mock_generate:
+            job = BulkProcessingJob(job_id="job", user_id=42, total_words=3)
+            await processor._process_job_async(job, ["дом", "кот", "сад"])
+
+        assert job.status == "completed"
+        assert job.generated_flashcards == 6
+        assert job.processed_word_types == {"noun": 3}
+        assert mock_generate.call_args.kwargs["user_id"] == 42
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_across_jobs(self):
+        """Test that no more than bulk_concurrency words run at once in total."""
+        with patch("app.my_graph.bulk_text_processor.settings.bulk_concurrency", 2):
+            processor = BulkTextProcessor()
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def analyze(word):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return {"success": False, "error": "test"}
+
+        with patch(
+            "app.my_graph.bulk_text_processor.analyze_russian_grammar_impl",
+            side_effect=analyze,
+        ):
+            job_words = [["дом", "кот", "сад"], ["лес", "мир", "сон"]]
+            jobs = [
+                BulkProcessingJob(job_id=f"job-{i}", user_id=i, total_words=3)
+                for i in range(len(job_words))
+            ]
+            await asyncio.gather(
+                *(
+                    processor._process_job_async(job, words)
+                    for job, words in zip(jobs, job_words)
+                )
+            )
+
+        assert all(job.status == "completed" for job in jobs)
+        assert all(job.processed_words == 3 for job in jobs)
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_analysis_is_reused_across_jobs(self):
+        """Test that a word analyzed by one job is not re-analyzed by the next."""
+        processor = BulkTextProcessor()
+
+        with patch.dict(grammar_analysis._analysis_cache, clear=True), patch(
+            "app.my_graph.tools.grammar_analysis._analyze",
+            return_value={"word": "дом", "success": True, "analysis": {}},
+        ) as mock_analyze, patch(
+            "app.my_graph.bulk_text_processor.generate_flashcards_from_analysis_impl",
+            return_value={"success": True, "flashcards_generated": 1},
+        ) as mock_generate:
+            for user_id in (1, 2):
+                job = BulkProcessingJob(
+                    job_id=f"job-{user_id}", user_id=user_id, total_words=1
+                )
+                await processor._process_job_async(job, ["дом"])
+
+        mock_analyze.assert_called_once_with("дом")
+        # Flashcards are saved per user, so they are generated for both jobs
+        assert [c.kwargs["user_id"] for c in mock_generate.call_args_list] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_share_an_in_flight_analysis(self):
+        """Test that jobs reaching the same word together share one analysis."""
+        processor = BulkTextProcessor()
+        release = threading.Event()
+
+        def analyze(word):
+            release.wait(timeout=5)
+            return {"success": True, "analysis": {}}
+
+        async def release_soon():
+            await asyncio.sleep(0.05)
+            release.set()
+
+        with patch(
+            "app.my_graph.bulk_text_processor.analyze_russian_grammar_impl",
+            side_effect=analyze,
+        ) as mock_analyze, patch(
+            "app.my_graph.bulk_text_processor.generate_flashcards_from_analysis_impl",
+            return_value={"success": True, "flashcards_generated": 1},
+        ) as mock_generate:
+            jobs = [
+                BulkProcessingJob(job_id=f"job-{i}", user_id=i, total_words=1)
+                for i in (1, 2)
+            ]
+            await asyncio.gather(
+                *(processor._process_job_async(job, ["дом"]) for job in jobs),
+                release_soon(),
+            )
+
+        mock_analyze.assert_called_once_with("дом")
+        assert mock_generate.call_count == 2
+        assert processor._pending_analyses == {}
+
+    @pytest.mark.asyncio
+    async def test_user_jobs_are_listed_newest_first(self):
+        """Test that get_user_jobs only returns the user's jobs, newest first."""
+        processor = BulkTextProcessor()
+
+        with patch.object(processor, "_process_job_async", new=AsyncMock()):
+            first = processor.start_bulk_processing("Мама мыла раму", 1)
+            other = processor.start_bulk_processing("Кот", 2)
+            second = processor.start_bulk_processing("Дом", 1)
+
+        jobs = processor.get_user_jobs(1)
+
+        assert [job["job_id"] for job in jobs] == [second, first]
+        assert [job["job_id"] for job in processor.get_user_jobs(2)] == [other]
+        assert processor.get_user_jobs(3) == []
+
+    def test_status_is_cached_only_once_job_finishes(self):
+        """Test that active jobs report live progress and finished ones are cached."""
+        processor = BulkTextProcessor()
+        job = BulkProcessingJob(job_id="job", user_id=1, total_words=2)
+        processor.active_jobs[job.job_id] = job
+
+        assert processor.get_job_status("job")["processed_words"] == 0
+        job.processed_words = 1
+        job.processed_word_types["noun"] = 1
+        status = processor.get_job_status("job")
+        assert status["processed_words"] == 1
+        # The loop keeps updating the job, so the status holds a copy
+        assert status["processed_word_types"] == {"noun": 1}
+        assert status["processed_word_types"] is not job.processed_word_types
+
+        job.processed_words = 2
+        job.status = "completed"
+        job.completed_at = datetime.utcnow()
+        status = processor.get_job_status("job")
+
+        assert status["status"] == "completed"
+        assert status["progress_percentage"] == 100.0
+        assert processor.get_job_status("job") is status
+
+    def test_status_built_while_job_finishes_is_not_cached(self):
+        """Test that a job finishing mid-build doesn't cache a stale status."""
+        processor = BulkTextProcessor()
+        job = BulkProcessingJob(job_id="job", user_id=1, total_words=1)
+        processor.active_jobs[job.job_id] = job
+
+        class FinishingList(list):
+            # The job finishes on the loop while the status is being built
+            def __len__(self):
+                job.processed_words = 1
+                job.status = "completed"
+                job.completed_at = datetime.utcnow()
+                return super().__len__()
+
+        job.failed_words = FinishingList()
+        status = processor.get_job_status("job")
+
+        assert status["completed_at"] is None
+        assert job.final_status is None
+        job.failed_words = []
+        status = processor.get_job_status("job")
+        assert status["status"] == "completed"
+        assert status["processed_words"] == 1
+        assert processor.get_job_status("job") is status
+
+    def test_cleanup_removes_old_jobs_from_user_index(self):
+        """Test that cleaned up jobs are no longer listed for their user."""
+        processor = BulkTextProcessor()
+        job = BulkProcessingJob(job_id="old", user_id=1)
+        job.finished_at = time.monotonic() - 48 * 3600
+        processor.completed_jobs[job.job_id] = job
+        processor.user_jobs[1] = {job.job_id: job}
+
+        processor.cleanup_old_jobs(max_age_hours=24)
+
+        assert processor.get_job_status("old") is None
+        assert processor.get_user_jobs(1) == []
+        assert 1 not in processor.user_jobs
+
+    @pytest.mark.asyncio
+    async def test_starting_a_job_cleans_up_expired_jobs(self):
+        """Test that expired jobs are dropped and fresh ones kept on job start."""
+        processor = BulkTextProcessor()
+        for job_id, age_hours in (("old", 48), ("fresh", 1)):
+            job = BulkProcessingJob(job_id=job_id, user_id=1)
+            job.finished_at = time.monotonic() - age_hours * 3600
+            processor.completed_jobs[job_id] = job
+            processor.user_jobs.setdefault(1, {})[job_id] = job
+
+        with patch.object(processor, "_process_job_async", new=AsyncMock()):
+            processor.start_bulk_processing("Дом", 1)
+
+        assert list(processor.completed_jobs) == ["fresh"]
+
+    def test_start_from_worker_thread_without_loop_raises(self):
+        """Test that starting a job with no loop available fails loudly."""
+        processor = BulkTextProcessor()
+
+        with pytest.raises(RuntimeError):
+            processor.start_bulk_processing("Привет мир", 1)
@@ -0,0 +1,387 @@
+"""Tests for the conversational Russian tutor chatbot."""
+
+import json
+import threading
+
+import pytest
+from unittest.mock import patch
+from pydantic import SecretStr
+from langchain_core.language_models import FakeMessagesListChatModel
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+
+from app.my_graph import chatbot_tutor
+from app.my_graph.chatbot_tutor import ConversationalRussianTutor
+from app.grammar.russian import WordClassification
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Drop cached replies so tests don't leak into each other."""
+    chatbot_tutor._response_cache.clear()
+    yield
+    chatbot_tutor._response_cache.clear()
+
+
+def make_tutor(*responses):
+    """Create a tutor whose LLM replies with the given messages in order."""
+    tutor = ConversationalRussianTutor(api_key=SecretStr("sk-test"))
+    tutor.llm_with_tools = FakeMessagesListChatModel(responses=list(responses))
+    tutor.fast_llm_with_tools = tutor.llm_with_tools
+    return tutor
+
+
+class TestConversationalRussianTutor:
+    """Test cases for ConversationalRussianTutor."""
+
+    @pytest.mark.asyncio
+    async def test_chat_async_runs_tool_calls(self):
+        """Test a turn where the LLM calls a tool and then answers."""
+        tutor = make_tutor(
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "translate_phrase",
+                        "args": {
+                            "text": "Hello",
+                            "from_lang": "english",
+                            "to_lang": "russian",
+                        },
+                        "id": "call_1",
+                    }
+                ],
+            ),
+            AIMessage(content="«Hello» по-русски — «Привет»."),
+        )
+
+        with patch(
+            "app.my_graph.chatbot_tutor.translate_phrase_impl",
+            return_value={"translation": "Привет", "success": True},
+        ) as mock_translate:
+            result = await tutor.chat_async("Translate hello", user_id=1)
+
+        assert result["success"] is True
+        assert result["response"] == "«Hello» по-русски — «Привет»."
+        mock_translate.assert_called_once_with("Hello", "english", "russian")
+        assert [type(m).__name__ for m in result["messages"]] == [
+            "SystemMessage",
+            "HumanMessage",
+            "AIMessage",
+            "ToolMessage",
+            "AIMessage",
+        ]
+        assert result["messages"][3].tool_call_id == "call_1"
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_concurrently(self):
+        """Test that several tool calls in one message run at the same time."""
+        # Each tool waits for the other, so this only finishes if both run together
+        barrier = threading.Barrier(2, timeout=5)
+
+        def translate(text, from_lang, to_lang):
+            barrier.wait()
+            return {"translation": text.upper(), "success": True}
+
+        tutor = make_tutor(
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "translate_phrase",
+                        "args": {"text": word, "from_lang": "en", "to_lang": "ru"},
+                        "id": f"call_{word}",
+                    }
+                    for word in ("cat", "dog")
+                ],
+            ),
+            AIMessage(content="Готово."),
+        )
+
+        with patch(
+            "app.my_graph.chatbot_tutor.translate_phrase_impl", side_effect=translate
+        ):
+            result = await tutor.chat_async("Translate cat and dog")
+
+        assert result["response"] == "Готово."
+        # Tool messages keep the order of the tool calls
+        assert list(result["tool_results"]) == ["call_cat", "call_dog"]
+        assert "CAT" in result["tool_results"]["call_cat"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_reports_error(self):
+        """Test that a call to a tool that doesn't exist returns an error result."""
+        tutor = make_tutor(
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "no_such_tool", "args": {}, "id": "call_1"}],
+            ),
+            AIMessage(content="Извините."),
+        )
+
+        result = await tutor.chat_async("Hi")
+
+        assert "Tool no_such_tool not found" in result["tool_results"]["call_1"]
+
+    @pytest.mark.asyncio
+    async def test_tool_results_are_sent_as_json(self):
+        """Test that tool results, including pydantic models, reach the LLM as JSON."""
+        tutor = make_tutor(
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "analyze_russian_grammar",
+                        "args": {"russian_word": "дом"},
+                        "id": "call_1",
+                    }
+                ],
+            ),
+            AIMessage(content="Это существительное."),
+        )
+        classification = WordClassification(
+            word_type="noun", russian_word="дом", original_word="дом"
+        )
+
+        with patch(
+            "app.my_graph.chatbot_tutor.analyze_russian_grammar_impl",
+            return_value={
+                "word": "дом",
+                "analysis": {"classification": classification},
+                "success": True,
+            },
+        ):
+            result = await tutor.chat_async("Что такое дом?")
+
+        content = result["tool_results"]["call_1"]
+        assert "дом" in content  # not \u-escaped
+        assert json.loads(content)["analysis"]["classification"] == {
+            "word_type": "noun",
+            "russian_word": "дом",
+            "original_word": "дом",
+        }
+
+    @pytest.mark.asyncio
+    async def test_tool_results_with_non_string_keys(self):
+        """Test that tool results keyed by numbers are still sent as JSON."""
+        tutor = make_tutor(
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "translate_phrase",
+                        "args": {"text": "one", "from_lang": "en", "to_lang": "ru"},
+                        "id": "call_1",
+                    }
+                ],
+            ),
+            AIMessage(content="Один."),
+        )
+
+        with patch(
+            "app.my_graph.chatbot_tutor.translate_phrase_impl",
+            return_value={"forms": {1: "один"}, "success": True},
+        ):
+            result = await tutor.chat_async("Translate one")
+
+        assert json.loads(result["tool_results"]["call_1"]) == {
+            "forms": {"1": "один"},
+            "success": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_chat_async_streams_tokens(self):
+        """Test that response tokens are passed to on_token as they are generated."""
+        tutor = make_tutor()
+        tutor.llm_with_tools = GenericFakeChatModel(
+            messages=iter([AIMessage(content="Привет, как дела?")])
+        )
+        tokens = []
+
+        async def on_token(token):
+            tokens.append(token)
+
+        result = await tutor.chat_async("Hi", on_token=on_token)
+
+        assert result["success"] is True
+        assert result["response"] == "Привет, как дела?"
+        assert len(tokens) > 1
+        assert "".join(tokens) == "Привет, как дела?"
+        # The stored reply is a complete message, not a stream chunk
+        assert type(result["messages"][-1]) is AIMessage
+
+    @pytest.mark.asyncio
+    async def test_chat_async_signals_each_new_reply(self):
+        """Test that on_reply_start separates the tokens of each response."""
+        tutor = make_tutor(
+            AIMessage(
+                content="Сейчас посмотрю.",
+                tool_calls=[
+                    {
+                        "name": "translate_phrase",
+                        "args": {"text": "cat", "from_lang": "en", "to_lang": "ru"},
+                        "id": "call_1",
+                    }
+                ],
+            ),
+            AIMessage(content="Кот."),
+        )
+        events = []
+
+        async def on_token(token):
+            events.append(token)
+
+        async def on_reply_start():
+            events.append(None)
+
+        with patch(
+            "app.my_graph.chatbot_tutor.translate_phrase_impl",
+            return_value={"translation": "кот", "success": True},
+        ):
+            result = await tutor.chat_async(
+                "Translate cat", on_token=on_token, on_reply_start=on_reply_start
+            )
+
+        assert result["response"] == "Кот."
+        assert events == [None, "Сейчас посмотрю.", None, "Кот."]
+
+    @pytest.mark.asyncio
+    async def test_repeated_conversation_is_answered_from_cache(self):
+        """Test that an identical conversation does not call the LLM again."""
+        tutor = make_tutor(AIMessage(content="Привет!"), AIMessage(content="Другое"))
+        tokens = []
+
+        async def on_token(token):
+            tokens.append(token)
+
+        first = await tutor.chat_async("Hi")
+        second = await tutor.chat_async("Hi", on_token=on_token)
+        third = await tutor.chat_async("Hello")
+
+        assert first["response"] == second["response"] == "Привет!"
+        assert tokens == ["Привет!"]
+        assert third["response"] == "Другое"
+
+    @pytest.mark.asyncio
+    async def test_long_history_is_trimmed(self):
+        """Test that only the most recent history is sent, starting on a human turn."""
+        tutor = make_tutor(AIMessage(content="Хорошо."))
+        history = []
+        for i in range(200):
+            history += [
+                HumanMessage(content=f"Вопрос {i} " * 20),
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "translate_phrase", "args": {}, "id": f"c{i}"}
+                    ],
+                ),
+                ToolMessage(content="{}", tool_call_id=f"c{i}"),
+                AIMessage(content=f"Ответ {i} " * 20),
+            ]
+
+        with patch.object(chatbot_tutor, "MAX_HISTORY_TOKENS", 1000):
+            result = await tutor.chat_async("Ещё вопрос", history)
+
+        messages = result["messages"]
+        assert len(messages) < len(history)
+        assert type(messages[1]) is HumanMessage
+        assert messages[-3].content == "Ответ 199 " * 20
+        assert messages[-2].content == "Ещё вопрос"
+        assert result["response"] == "Хорошо."
+
+    @pytest.mark.asyncio
+    async def test_cached_tool_call_uses_callers_user_id(self):
+        """Test that a tool call reused from the cache runs for the new caller."""
+        tool_call_message = AIMessage(
+            content="",
+            tool_calls=[
+                {
+                    "name": "generate_flashcards_from_analysis",
+                    "args": {"word": "дом", "user_id": 999},
+                    "id": "call_1",
+                }
+            ],
+        )
+        tutor = make_tutor(
+            tool_call_message,
+            AIMessage(content="Готово."),
+            AIMessage(content="Готово."),
+        )
+
+        with patch(
+            "app.my_graph.chatbot_tutor.generate_flashcards_from_analysis_impl",
+            return_value={"success": True},
+        ) as mock_generate:
+            for user_id in (1, 2):
+                await tutor.chat_async("Сделай карточки для дом", user_id=user_id)
+
+        assert [c.args[3] for c in mock_generate.call_args_list] == [1, 2]
+        assert tool_call_message.tool_calls[0]["args"]["user_id"] == 999
+
+    @pytest.mark.asyncio
+    async def test_history_system_message_is_replaced(self):
+        """Test that the prompt always starts with the tutor's own system message."""
+        tutor = make_tutor(AIMessage(content="Хорошо."))
+        history = [SystemMessage(content="Old prompt"), HumanMessage(content="Hi")]
+
+        result = await tutor.chat_async("Ещё", history)
+
+        assert result["messages"][0] is chatbot_tutor.SYSTEM_MESSAGE
+        assert [type(m).__name__ for m in result["messages"]].count(
+            "SystemMessage"
+        ) == 1
+
+    @pytest.mark.asyncio
+    async def test_reply_to_tool_results_uses_fast_model(self):
+        """Test that only the turn answering tool results goes to the fast model."""
+        tutor = make_tutor(
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "translate_phrase",
+                        "args": {"text": "cat", "from_lang": "en", "to_lang": "ru"},
+                        "id": "call_1",
+                    }
+                ],
+            )
+        )
+        tutor.fast_llm_with_tools = FakeMessagesListChatModel(
+            responses=[AIMessage(content="Кот.")]
+        )
+
+        with patch(
+            "app.my_graph.chatbot_tutor.translate_phrase_impl",
+            return_value={"translation": "кот", "success": True},
+        ):
+            result = await tutor.chat_async("Translate cat")
+
+        assert result["response"] == "Кот."
+
+    def test_tutors_share_bound_llm(self):
+        """Test that tutors with the same key and model reuse the bound LLM."""
+        first = ConversationalRussianTutor(api_key=SecretStr("sk-test"))
+        second = ConversationalRussianTutor(api_key=SecretStr("sk-test"))
+        other_model = ConversationalRussianTutor(
+            api_key=SecretStr("sk-test"), model="gpt-4o-mini"
+        )
+
+        assert second.llm_with_tools is first.llm_with_tools
+        assert second.tools is first.tools
+        assert other_model.llm_with_tools is not first.llm_with_tools
+        assert other_model.llm.model_name == "gpt-4o-mini"
+
+    def test_chat_sync_wrapper(self):
+        """Test that the synchronous chat wrapper runs the async graph."""
+        tutor = make_tutor(AIMessage(content="Привет!"))
+
+        result = tutor.chat("Hi")
+
+        assert result["success"] is True
+        assert result["response"] == "Привет!"
@@ -0,0 +1,62 @@
+"""Tests for structured LLM output parsers."""
+
+import pytest
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage
+
+from app.my_graph.output_parsers import PydanticJsonOutputParser
+from app.grammar.russian import WordClassification
+
+
+class TestPydanticJsonOutputParser:
+    """Test cases for the single-pass JSON output parser."""
+
+    def test_parses_plain_json(self):
+        """Test parsing a bare JSON object into the model."""
+        parser = PydanticJsonOutputParser(pydantic_object=WordClassification)
+
+        result = parser.invoke(
+            AIMessage(
+                content='{"word_type": "noun", "russian_word": "дом", "original_word": "house"}'
+            )
+        )
+
+        assert isinstance(result, WordClassification)
+        assert result.word_type == "noun"
+        assert result.russian_word == "дом"
+
+    def test_parses_fenced_json(self):
+        """Test parsing JSON wrapped in a markdown code fence."""
+        parser = PydanticJsonOutputParser(pydantic_object=WordClassification)
+
+        result = parser.invoke(
+            AIMessage(
+                content='```json\n{"word_type": "verb", "russian_word": "читать", "original_word": "read"}\n```'
+            )
+        )
+
+        assert result.word_type == "verb"
+        assert result.original_word == "read"
+
+    def test_falls_back_for_json_inside_prose(self):
+        """Test that responses with text around the JSON still parse."""
+        parser = PydanticJsonOutputParser(pydantic_object=WordClassification)
+
+        result = parser.invoke(
+            AIMessage(
+                content='Here you go:\n```json\n{"word_type": "adjective", "russian_word": "новый", "original_word": "new"}\n```'
+            )
+        )
+
+        assert result.word_type == "adjective"
+
+    def test_invalid_data_raises_output_parser_exception(self):
+        """Test that schema violations surface as OutputParserException."""
+        parser = PydanticJsonOutputParser(pydantic_object=WordClassification)
+
+        with pytest.raises(OutputParserException):
+            parser.invoke(
+                AIMessage(
+                    content='{"word_type": "gerund", "russian_word": "дом", "original_word": "дом"}'
+                )
+            )
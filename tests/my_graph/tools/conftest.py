@@ -0,0 +1,20 @@
+"""Shared fixtures for my_graph.tools tests."""
+
+import pytest
+
+from app.my_graph.tools import grammar_analysis
+from app.my_graph.utils import llm
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_cache():
+    """Drop cached LLM clients, responses and analyses so tests don't leak into each other."""
+
+    def clear():
+        llm.get_llm.cache_clear()
+        llm.response_cache.clear()
+        grammar_analysis._analysis_cache.clear()
+
+    clear()
+    yield
+    clear()
@@ -138,7 +138,7 @@ class TestFlashcardGeneration:
 
     def test_generate_flashcards_from_analysis_with_word_parameter(self):
         """Test flashcard generation using word parameter instead of analysis_data."""
-        with patch('app.my_graph.tools.grammar_analysis.analyze_russian_grammar_impl') as mock_analyze, \
+        with patch('app.my_graph.tools.flashcard_generation.analyze_russian_grammar_impl') as mock_analyze, \
              patch('app.my_graph.tools.flashcard_generation.flashcard_generator') as mock_fg, \
              patch('app.my_graph.tools.flashcard_generation.flashcard_service') as mock_fs:
             
@@ -225,6 +225,43 @@ class TestFlashcardGeneration:
             assert result["flashcards_generated"] == 2  # 2 calls, 1 each
             assert len(result["word_types"]) == 2
 
+    def test_generate_flashcards_from_analysis_list_runs_in_parallel(self):
+        """Test that the words of a list input are generated concurrently."""
+        import threading
+
+        # Each word waits for the other, so this only finishes if both run together
+        barrier = threading.Barrier(2, timeout=5)
+
+        def generate(grammar_obj, word_type, *args):
+            barrier.wait()
+            return [TwoSidedCard(user_id=1, front="a", back="b")]
+
+        analysis_list = [
+            {"analysis": {"noun_grammar": Mock()}},
+            {"analysis": {"verb_grammar": Mock()}},
+        ]
+
+        with patch('app.my_graph.tools.flashcard_generation.flashcard_generator') as mock_fg, \
+             patch('app.my_graph.tools.flashcard_generation.flashcard_service') as mock_fs:
+            mock_fg.generate_flashcards_from_grammar.side_effect = generate
+            mock_fg.save_flashcards_to_database.return_value = 1
+            mock_fs.db.get_processed_word.return_value = None
+
+            result = generate_flashcards_from_analysis_impl(analysis_list, user_id=1)
+
+        assert result["success"] is True
+        assert result["flashcards_generated"] == 2
+        assert result["word_types"] == ["noun", "verb"]
+
+    def test_generate_flashcards_from_empty_analysis_list(self):
+        """Test that an empty list generates nothing without failing."""
+        with patch('app.my_graph.tools.flashcard_generation.flashcard_generator') as mock_fg:
+            result = generate_flashcards_from_analysis_impl([], user_id=1)
+
+        assert result["success"] is True
+        assert result["flashcards_generated"] == 0
+        mock_fg.generate_flashcards_from_grammar.assert_not_called()
+
     def test_generate_flashcards_from_analysis_existing_word_update(self):
         """Test updating existing processed word stats."""
         noun_data = {
@@ -541,12 +578,7 @@ class TestFlashcardGeneration:
         mock_flashcards = [TwoSidedCard(user_id=1, front="книга", back="book", word_type=WordType.NOUN)]
         
         with patch('app.my_graph.tools.flashcard_generation.flashcard_generator') as mock_fg, \
-             patch('app.my_graph.tools.flashcard_generation.flashcard_service') as mock_fs, \
-             patch('app.my_graph.tools.flashcard_generation.Noun') as mock_noun:
-            
-            mock_noun_instance = Mock()
-            mock_noun_instance.dictionary_form = "книга"
-            mock_noun.return_value = mock_noun_instance
+             patch('app.my_graph.tools.flashcard_generation.flashcard_service') as mock_fs:
             
             mock_fg.generate_flashcards_from_grammar.return_value = mock_flashcards
             mock_fg.save_flashcards_to_database.return_value = 1
@@ -555,4 +587,8 @@ class TestFlashcardGeneration:
             result = generate_flashcards_from_analysis_impl(analysis_data, user_id=1)
             
             assert result["success"] is True
-            mock_noun.assert_called_once()  # Verify Pydantic model was created from dict
\ No newline at end of file
+            # Verify Pydantic model was created from dict
+            grammar_obj, word_type = mock_fg.generate_flashcards_from_grammar.call_args[0][:2]
+            assert isinstance(grammar_obj, Noun)
+            assert grammar_obj.dictionary_form == "книга"
+            assert word_type == "noun"
\ No newline at end of file
@@ -4,8 +4,10 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pydantic import ValidationError
 
+from app.my_graph import prompts
+from app.my_graph.tools import grammar_analysis
 from app.my_graph.tools.grammar_analysis import analyze_russian_grammar_impl
-from app.grammar.russian import WordClassification, Noun, Adjective, Verb, Pronoun, Number
+from app.grammar.russian import WordClassification, Noun, Adjective, Verb, Pronoun, Number, GRAMMAR_MODELS
 
 
 class TestGrammarAnalysis:
@@ -45,10 +47,11 @@ class TestGrammarAnalysis:
         )
         
         # Mock the entire analysis process
-        with patch('app.my_graph.tools.grammar_analysis.ChatOpenAI') as mock_openai, \
+        with patch('app.my_graph.utils.llm.ChatOpenAI') as mock_openai, \
              patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.get_noun_grammar_prompt') as mock_noun_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser') as mock_parser:
+             patch.dict('app.my_graph.tools.grammar_analysis._GRAMMAR_PROMPTS', noun=Mock()) as grammar_prompts, \
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser') as mock_parser:
+            mock_noun_prompt = grammar_prompts["noun"]
             
             # Mock chains to return our expected results
             mock_classification_chain = Mock()
@@ -122,10 +125,11 @@ class TestGrammarAnalysis:
         )
         
         # Mock the entire analysis process
-        with patch('app.my_graph.tools.grammar_analysis.ChatOpenAI') as mock_openai, \
+        with patch('app.my_graph.utils.llm.ChatOpenAI') as mock_openai, \
              patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.get_adjective_grammar_prompt') as mock_adj_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser') as mock_parser:
+             patch.dict('app.my_graph.tools.grammar_analysis._GRAMMAR_PROMPTS', adjective=Mock()) as grammar_prompts, \
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser') as mock_parser:
+            mock_adj_prompt = grammar_prompts["adjective"]
             
             # Mock chains to return our expected results
             mock_classification_chain = Mock()
@@ -151,7 +155,7 @@ class TestGrammarAnalysis:
             assert result["analysis"]["adjective_grammar"] == mock_adjective
             assert result["analysis"]["classification"] == mock_classification
 
-    @patch('app.my_graph.tools.grammar_analysis.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_analyze_russian_grammar_verb_success(self, mock_openai):
         """Test successful grammar analysis for a verb."""
         mock_classification = WordClassification(
@@ -183,8 +187,9 @@ class TestGrammarAnalysis:
         mock_verb_chain.invoke.return_value = mock_verb
         
         with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.get_verb_grammar_prompt') as mock_verb_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser'):
+             patch.dict('app.my_graph.tools.grammar_analysis._GRAMMAR_PROMPTS', verb=Mock()) as grammar_prompts, \
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
+            mock_verb_prompt = grammar_prompts["verb"]
             
             # Create a mock that returns our chains when __or__ is called
             mock_intermediate1 = Mock()
@@ -201,7 +206,7 @@ class TestGrammarAnalysis:
             assert result["word"] == "читать"
             assert result["analysis"]["verb_grammar"] == mock_verb
 
-    @patch('app.my_graph.tools.grammar_analysis.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_analyze_russian_grammar_unsupported_word_type(self, mock_openai):
         """Test handling of unsupported word types like adverbs."""
         mock_classification = WordClassification(
@@ -214,7 +219,7 @@ class TestGrammarAnalysis:
         mock_classification_chain.invoke.return_value = mock_classification
         
         with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser'):
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
             
             # Create a mock that returns our chains when __or__ is called
             mock_intermediate1 = Mock()
@@ -228,14 +233,89 @@ class TestGrammarAnalysis:
             assert result["word_type"] == "adverb"
             assert "detailed grammar analysis is not yet supported" in result["message"]
 
-    @patch('app.my_graph.tools.grammar_analysis.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
+    def test_analyze_russian_grammar_reuses_analysis(self, mock_openai):
+        """Test that a word asked about again is not sent to the LLM again."""
+        mock_classification = WordClassification(
+            word_type="adverb",
+            russian_word="быстро",
+            original_word="быстро"
+        )
+
+        mock_classification_chain = Mock()
+        mock_classification_chain.invoke.return_value = mock_classification
+
+        with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
+
+            mock_intermediate1 = Mock()
+            mock_intermediate1.__or__ = Mock(return_value=mock_classification_chain)
+            mock_class_prompt.__or__ = Mock(return_value=mock_intermediate1)
+
+            first = analyze_russian_grammar_impl("быстро")
+            second = analyze_russian_grammar_impl(" Быстро ")
+
+        mock_classification_chain.invoke.assert_called_once()
+        assert second["success"] is True
+        assert second["word"] == " Быстро "
+        # The analysis is shared, but reports the second caller's input
+        assert first["analysis"]["original_human_input"] == "быстро"
+        assert second["analysis"] == {**first["analysis"], "original_human_input": " Быстро "}
+
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
+    def test_analyze_russian_grammar_cached_analysis_is_copied(self, mock_openai):
+        """Test that changing a returned analysis does not change the cached one."""
+        mock_classification = WordClassification(
+            word_type="adverb",
+            russian_word="быстро",
+            original_word="быстро"
+        )
+
+        mock_classification_chain = Mock()
+        mock_classification_chain.invoke.return_value = mock_classification
+
+        with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
+
+            mock_intermediate1 = Mock()
+            mock_intermediate1.__or__ = Mock(return_value=mock_classification_chain)
+            mock_class_prompt.__or__ = Mock(return_value=mock_intermediate1)
+
+            first = analyze_russian_grammar_impl("быстро")
+            first["analysis"]["final_answer"] = "changed"
+            second = analyze_russian_grammar_impl("быстро")
+            second["analysis"]["final_answer"] = "changed again"
+            third = analyze_russian_grammar_impl("быстро")
+
+        assert third["analysis"]["final_answer"] is None
+
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
+    def test_analyze_russian_grammar_does_not_cache_errors(self, mock_openai):
+        """Test that a failed analysis is retried on the next call."""
+        mock_classification_chain = Mock()
+        mock_classification_chain.invoke.side_effect = Exception("API Error")
+
+        with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
+
+            mock_intermediate1 = Mock()
+            mock_intermediate1.__or__ = Mock(return_value=mock_classification_chain)
+            mock_class_prompt.__or__ = Mock(return_value=mock_intermediate1)
+
+            analyze_russian_grammar_impl("тест")
+            result = analyze_russian_grammar_impl("тест")
+
+        assert result["success"] is False
+        assert mock_classification_chain.invoke.call_count == 2
+
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_analyze_russian_grammar_classification_error(self, mock_openai):
         """Test error handling during classification step."""
         mock_classification_chain = Mock()
         mock_classification_chain.invoke.side_effect = Exception("API Error")
         
         with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser'):
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
             
             # Create a mock that returns our chains when __or__ is called
             mock_intermediate1 = Mock()
@@ -249,7 +329,7 @@ class TestGrammarAnalysis:
             assert "error" in result
             assert "API Error" in result["error"]
 
-    @patch('app.my_graph.tools.grammar_analysis.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_analyze_russian_grammar_grammar_analysis_error(self, mock_openai):
         """Test error handling during detailed grammar analysis."""
         mock_classification = WordClassification(
@@ -265,8 +345,9 @@ class TestGrammarAnalysis:
         mock_noun_chain.invoke.side_effect = Exception("Invalid data")
         
         with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.get_noun_grammar_prompt') as mock_noun_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser'):
+             patch.dict('app.my_graph.tools.grammar_analysis._GRAMMAR_PROMPTS', noun=Mock()) as grammar_prompts, \
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
+            mock_noun_prompt = grammar_prompts["noun"]
             
             # Create a mock that returns our chains when __or__ is called
             mock_intermediate1 = Mock()
@@ -283,7 +364,7 @@ class TestGrammarAnalysis:
             assert result["word"] == "тест"
             assert "error" in result
 
-    @patch('app.my_graph.tools.grammar_analysis.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_analyze_russian_grammar_pronoun_success(self, mock_openai):
         """Test successful grammar analysis for a pronoun."""
         mock_classification = WordClassification(
@@ -312,8 +393,9 @@ class TestGrammarAnalysis:
         mock_pronoun_chain.invoke.return_value = mock_pronoun
         
         with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.get_pronoun_grammar_prompt') as mock_pronoun_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser'):
+             patch.dict('app.my_graph.tools.grammar_analysis._GRAMMAR_PROMPTS', pronoun=Mock()) as grammar_prompts, \
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
+            mock_pronoun_prompt = grammar_prompts["pronoun"]
             
             # Create a mock that returns our chains when __or__ is called
             mock_intermediate1 = Mock()
@@ -330,7 +412,7 @@ class TestGrammarAnalysis:
             assert result["word"] == "я"
             assert result["analysis"]["pronoun_grammar"] == mock_pronoun
 
-    @patch('app.my_graph.tools.grammar_analysis.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_analyze_russian_grammar_number_success(self, mock_openai):
         """Test successful grammar analysis for a number."""
         mock_classification = WordClassification(
@@ -375,8 +457,9 @@ class TestGrammarAnalysis:
         mock_number_chain.invoke.return_value = mock_number
         
         with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.get_number_grammar_prompt') as mock_number_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser'):
+             patch.dict('app.my_graph.tools.grammar_analysis._GRAMMAR_PROMPTS', number=Mock()) as grammar_prompts, \
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
+            mock_number_prompt = grammar_prompts["number"]
             
             # Create a mock that returns our chains when __or__ is called
             mock_intermediate1 = Mock()
@@ -410,7 +493,7 @@ class TestGrammarAnalysis:
         mock_settings.openai_api_key = "test-key"
         mock_settings.llm_model = "gpt-4"
         
-        with patch('app.my_graph.tools.grammar_analysis.ChatOpenAI') as mock_openai:
+        with patch('app.my_graph.utils.llm.ChatOpenAI') as mock_openai:
             mock_llm = Mock()
             mock_openai.return_value = mock_llm
             
@@ -425,4 +508,15 @@ class TestGrammarAnalysis:
                 # Should have been called with correct settings
                 mock_openai.assert_called_once()
                 call_args = mock_openai.call_args
-                assert call_args[1]['model'] == "gpt-4"
\ No newline at end of file
+                assert call_args[1]['model'] == "gpt-4"
+
+    def test_every_grammar_model_has_a_prompt(self):
+        """Test that each supported word type gets its own grammar prompt."""
+        assert grammar_analysis._GRAMMAR_PROMPTS == {
+            "noun": prompts.get_noun_grammar_prompt,
+            "adjective": prompts.get_adjective_grammar_prompt,
+            "verb": prompts.get_verb_grammar_prompt,
+            "pronoun": prompts.get_pronoun_grammar_prompt,
+            "number": prompts.get_number_grammar_prompt,
+        }
+        assert list(grammar_analysis._GRAMMAR_PROMPTS) == list(GRAMMAR_MODELS)
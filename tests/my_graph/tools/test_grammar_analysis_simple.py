@@ -9,7 +9,7 @@ from app.my_graph.tools.grammar_analysis import analyze_russian_grammar_impl
 class TestGrammarAnalysisSimple:
     """Simplified test cases for Russian grammar analysis functionality."""
 
-    @patch('app.my_graph.tools.grammar_analysis.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_analyze_russian_grammar_basic_success(self, mock_openai):
         """Test basic successful grammar analysis."""
         from app.grammar.russian import WordClassification, Noun
@@ -37,8 +37,9 @@ class TestGrammarAnalysisSimple:
         mock_noun_chain.invoke.return_value = mock_noun
         
         with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.get_noun_grammar_prompt') as mock_noun_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser'):
+             patch.dict('app.my_graph.tools.grammar_analysis._GRAMMAR_PROMPTS', noun=Mock()) as grammar_prompts, \
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
+            mock_noun_prompt = grammar_prompts["noun"]
             
             mock_class_prompt.__or__ = Mock(return_value=mock_classification_chain)
             mock_noun_prompt.__or__ = Mock(return_value=mock_noun_chain)
@@ -49,14 +50,14 @@ class TestGrammarAnalysisSimple:
             assert result["word"] == "дом"
             assert "analysis" in result
 
-    @patch('app.my_graph.tools.grammar_analysis.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_analyze_russian_grammar_error(self, mock_openai):
         """Test error handling in grammar analysis."""
         mock_classification_chain = Mock()
         mock_classification_chain.invoke.side_effect = Exception("API connection failed")
         
         with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser'):
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
             
             # Create a mock that returns our chains when __or__ is called
             mock_intermediate1 = Mock()
@@ -69,7 +70,7 @@ class TestGrammarAnalysisSimple:
             assert result["word"] == "тест"
             assert "error" in result
 
-    @patch('app.my_graph.tools.grammar_analysis.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_analyze_russian_grammar_unsupported_type(self, mock_openai):
         """Test handling of unsupported word types."""
         from app.grammar.russian import WordClassification
@@ -84,7 +85,7 @@ class TestGrammarAnalysisSimple:
         mock_classification_chain.invoke.return_value = mock_classification
         
         with patch('app.my_graph.tools.grammar_analysis.initial_classification_prompt') as mock_class_prompt, \
-             patch('app.my_graph.tools.grammar_analysis.PydanticOutputParser'):
+             patch('app.my_graph.tools.grammar_analysis.PydanticJsonOutputParser'):
             
             mock_class_prompt.__or__ = Mock(return_value=mock_classification_chain)
             
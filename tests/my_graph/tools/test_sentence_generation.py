@@ -76,9 +76,36 @@ class TestSentenceGeneration:
         
         assert result["success"] is True
         assert len(result["examples"]) == 3
-        assert result["examples"][0] == "Собака бежит в парке."
-        assert result["examples"][1] == "Моя собака очень дружелюбная."
-        assert result["examples"][2] == "Собака лает на кота."
+        # The sentences are generated in parallel, so their order may vary
+        assert sorted(result["examples"]) == sorted([
+            "Собака бежит в парке.",
+            "Моя собака очень дружелюбная.",
+            "Собака лает на кота."
+        ])
+
+    @patch('app.my_graph.tools.sentence_generation.LLMSentenceGenerator')
+    def test_generate_example_sentences_run_in_parallel(self, mock_generator_class):
+        """Test that the three example sentences are generated concurrently."""
+        import threading
+
+        # Each call waits for the other two, so this only finishes if all run together
+        barrier = threading.Barrier(3, timeout=5)
+
+        def generate(*args):
+            barrier.wait()
+            return "Собака бежит в парке."
+
+        mock_generator = Mock()
+        mock_generator.generate_example_sentence.side_effect = generate
+        mock_generator_class.return_value = mock_generator
+
+        result = generate_example_sentences_impl(
+            word="собака",
+            grammatical_context="nominative case, feminine noun"
+        )
+
+        assert result["success"] is True
+        assert len(result["examples"]) == 3
 
     @patch('app.my_graph.tools.sentence_generation.LLMSentenceGenerator')
     def test_generate_example_sentences_verb_context(self, mock_generator_class):
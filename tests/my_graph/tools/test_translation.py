@@ -9,7 +9,7 @@ from app.my_graph.tools.translation import translate_phrase_impl
 class TestTranslation:
     """Test cases for phrase translation functionality."""
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_russian_to_english(self, mock_openai):
         """Test translation from Russian to English."""
         mock_response = Mock()
@@ -38,7 +38,7 @@ class TestTranslation:
         assert "Russian" in call_args[0].content
         assert "English" in call_args[0].content
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_english_to_russian(self, mock_openai):
         """Test translation from English to Russian."""
         mock_response = Mock()
@@ -60,7 +60,7 @@ class TestTranslation:
         assert result["from_language"] == "English"
         assert result["to_language"] == "Russian"
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_german_to_russian(self, mock_openai):
         """Test translation from German to Russian."""
         mock_response = Mock()
@@ -82,7 +82,7 @@ class TestTranslation:
         assert result["from_language"] == "German"
         assert result["to_language"] == "Russian"
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_with_grammar_notes(self, mock_openai):
         """Test translation that includes grammatical notes."""
         mock_response = Mock()
@@ -106,7 +106,7 @@ Grammatical note: The verb "люблю" (love) is in first person singular prese
         assert "Grammatical note" in result["translation"]
         assert "accusative case" in result["translation"]
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_llm_error(self, mock_openai):
         """Test error handling when LLM call fails."""
         mock_llm = Mock()
@@ -124,7 +124,7 @@ Grammatical note: The verb "люблю" (love) is in first person singular prese
         assert "error" in result
         assert "Network timeout" in result["error"]
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_empty_text(self, mock_openai):
         """Test translation of empty text."""
         mock_response = Mock()
@@ -140,7 +140,7 @@ Grammatical note: The verb "люблю" (love) is in first person singular prese
         assert result["original"] == ""
         assert result["translation"] == ""
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_very_long_text(self, mock_openai):
         """Test translation of very long text."""
         long_text = "This is a very long sentence that contains many words. " * 50
@@ -157,7 +157,7 @@ Grammatical note: The verb "люблю" (love) is in first person singular prese
         assert result["original"] == long_text
         assert len(result["translation"]) > 0
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_special_characters(self, mock_openai):
         """Test translation of text with special characters and punctuation."""
         text_with_special = "Hello, world! How are you? I'm fine... (really!)"
@@ -174,7 +174,7 @@ Grammatical note: The verb "люблю" (love) is in first person singular prese
         assert result["original"] == text_with_special
         assert "Привет, мир!" in result["translation"]
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_numbers_and_dates(self, mock_openai):
         """Test translation of text containing numbers and dates."""
         text_with_numbers = "I was born on January 15, 1990, and I am 33 years old."
@@ -192,7 +192,7 @@ Grammatical note: The verb "люблю" (love) is in first person singular prese
         assert "1990" in result["translation"]
         assert "33" in result["translation"]
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_technical_terms(self, mock_openai):
         """Test translation of text with technical/specialized terms."""
         technical_text = "Machine learning algorithms use neural networks for pattern recognition."
@@ -209,7 +209,7 @@ Grammatical note: The verb "люблю" (love) is in first person singular prese
         assert "машинного обучения" in result["translation"]
         assert "нейронные сети" in result["translation"]
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_idiomatic_expressions(self, mock_openai):
         """Test translation of idiomatic expressions."""
         idiomatic_text = "It's raining cats and dogs today."
@@ -226,7 +226,7 @@ Grammatical note: The verb "люблю" (love) is in first person singular prese
         assert result["original"] == idiomatic_text
         assert "как из ведра" in result["translation"]
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_russian_to_german(self, mock_openai):
         """Test translation from Russian to German."""
         mock_response = Mock()
@@ -253,7 +253,7 @@ Grammatical note: The verb "люблю" (love) is in first person singular prese
         mock_settings.openai_api_key = "test-key"
         mock_settings.llm_model = "gpt-4"
         
-        with patch('app.my_graph.tools.translation.ChatOpenAI') as mock_openai:
+        with patch('app.my_graph.utils.llm.ChatOpenAI') as mock_openai:
             mock_llm = Mock()
             mock_llm.invoke.side_effect = Exception("Test exception")
             mock_openai.return_value = mock_llm
@@ -265,7 +265,7 @@ Grammatical note: The verb "люблю" (love) is in first person singular prese
             call_args = mock_openai.call_args
             assert call_args[1]['model'] == "gpt-4"
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_preserve_formatting(self, mock_openai):
         """Test that translation preserves basic formatting."""
         formatted_text = """Line 1
@@ -289,7 +289,7 @@ Line 2
         assert "\n" in result["translation"]
         assert "- " in result["translation"]
 
-    @patch('app.my_graph.tools.translation.ChatOpenAI')
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
     def test_translate_phrase_mixed_languages_input(self, mock_openai):
         """Test translation of text that already contains mixed languages."""
         mixed_text = "I want to learn русский язык"
@@ -304,4 +304,33 @@ Line 2
         
         assert result["success"] is True
         assert result["original"] == mixed_text
-        assert "русский язык" in result["translation"]
\ No newline at end of file
+        assert "русский язык" in result["translation"]
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
+    def test_translate_phrase_reuses_llm_client(self, mock_openai):
+        """Test that repeated translations share one LLM client."""
+        mock_response = Mock()
+        mock_response.content = "Привет"
+        mock_openai.return_value.invoke.return_value = mock_response
+
+        translate_phrase_impl("Hello", "English", "Russian")
+        translate_phrase_impl("Hi", "English", "Russian")
+
+        mock_openai.assert_called_once()
+        assert mock_openai.return_value.invoke.call_count == 2
+
+    @patch('app.my_graph.utils.llm.ChatOpenAI')
+    def test_translate_phrase_caches_responses(self, mock_openai):
+        """Test that translating the same text twice only asks the LLM once."""
+        from langchain_core.language_models import FakeListChatModel
+
+        mock_openai.side_effect = lambda **kwargs: FakeListChatModel(
+            responses=["Привет", "Здравствуйте"], cache=kwargs["cache"]
+        )
+
+        first = translate_phrase_impl("Hello", "English", "Russian")
+        second = translate_phrase_impl("  Hello ", "English", "Russian")
+        other = translate_phrase_impl("Good day", "English", "Russian")
+
+        assert first["translation"] == second["translation"] == "Привет"
+        assert other["translation"] == "Здравствуйте"
+        assert mock_openai.call_args.kwargs["temperature"] == 0
@@ -1,12 +1,109 @@
 """Tests for MongoDB connection and database functionality."""
 
 import pytest
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from pymongo.errors import (
+    BulkWriteError,
+    ConnectionFailure,
+    ServerSelectionTimeoutError,
+)
 from app.flashcards.database import FlashcardDatabaseV2
 from app.flashcards.models import TwoSidedCard, FlashcardType, DifficultyLevel
 
 
+_MISSING = object()
+
+
+def _bson_rank(value):
+    """Rank of a value's type in MongoDB's comparison order."""
+    if value is _MISSING or value is None:
+        return 0
+    if isinstance(value, bool):
+        return 3
+    if isinstance(value, (int, float)):
+        return 1
+    if isinstance(value, str):
+        return 2
+    return 4  # datetime
+
+
+def _bson_type(value):
+    if value is _MISSING:
+        return "missing"
+    if value is None:
+        return "null"
+    if isinstance(value, datetime):
+        return "date"
+    return type(value).__name__
+
+
+def _compare(a, b):
+    """Compare like an aggregation expression: across types by BSON order."""
+    if _bson_rank(a) != _bson_rank(b) or _bson_rank(a) == 0:
+        return (_bson_rank(a) > _bson_rank(b)) - (_bson_rank(a) < _bson_rank(b))
+    return (a > b) - (a < b)
+
+
+class FakeStatsCollection:
+    """In-memory collection running the queries used for flashcard stats.
+
+    Queries only compare values of the same type, as MongoDB does, while
+    aggregation expressions compare any two values.
+    """
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def _matches(self, document, query):
+        for field, condition in query.items():
+            value = document.get(field, _MISSING)
+            if not isinstance(condition, dict):
+                if value != condition:
+                    return False
+                continue
+            for op, bound in condition.items():
+                if _bson_rank(value) != _bson_rank(bound) or value is _MISSING:
+                    return False
+                if not {"$lte": value <= bound, "$gte": value >= bound}[op]:
+                    return False
+        return True
+
+    def _evaluate(self, expression, document):
+        if isinstance(expression, str) and expression.startswith("$"):
+            return document.get(expression[1:], _MISSING)
+        if not isinstance(expression, dict):
+            return expression
+        ((op, args),) = expression.items()
+        if op == "$type":
+            return _bson_type(self._evaluate(args, document))
+        if op == "$cond":
+            condition, then, otherwise = args
+            chosen = then if self._evaluate(condition, document) else otherwise
+            return self._evaluate(chosen, document)
+        if op == "$and":
+            return all(self._evaluate(arg, document) for arg in args)
+        left, right = (self._evaluate(arg, document) for arg in args)
+        order = _compare(left, right)
+        return {"$eq": order == 0, "$lte": order <= 0, "$gte": order >= 0}[op]
+
+    def count_documents(self, query):
+        return sum(self._matches(document, query) for document in self.documents)
+
+    def aggregate(self, pipeline):
+        match, group = pipeline
+        documents = [d for d in self.documents if self._matches(d, match["$match"])]
+        if not documents:
+            return iter([])
+        result = {"_id": None}
+        for key, accumulator in group["$group"].items():
+            if key != "_id":
+                result[key] = sum(
+                    self._evaluate(accumulator["$sum"], d) for d in documents
+                )
+        return iter([result])
+
+
 class TestMongoDBConnection:
     """Test cases for MongoDB connection and basic database operations."""
 
@@ -110,6 +207,58 @@ class TestMongoDBConnection:
         assert result_id == "test_id_123"
         assert mock_collection.insert_one.called
 
+    @staticmethod
+    def _make_cards(count):
+        return [
+            TwoSidedCard(
+                user_id=1,
+                front=f"Question {i}",
+                back=f"Answer {i}",
+                type=FlashcardType.TWO_SIDED,
+                tags=["test"],
+                difficulty=DifficultyLevel.EASY,
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _assign_ids(documents, ordered):
+        # Mimic pymongo, which sets _id on each document it inserts
+        for i, document in enumerate(documents):
+            document["_id"] = f"id_{i}"
+
+    @patch("app.flashcards.database.FlashcardDatabaseV2._connect")
+    def test_add_flashcards_bulk_with_mock(self, mock_connect):
+        """Test adding several flashcards with a single insert_many call."""
+        db = FlashcardDatabaseV2()
+        db.collection = Mock()
+        db.collection.insert_many.side_effect = self._assign_ids
+
+        result_ids = db.add_flashcards_bulk(self._make_cards(3))
+
+        assert result_ids == ["id_0", "id_1", "id_2"]
+        db.collection.insert_many.assert_called_once()
+        assert db.collection.insert_many.call_args.kwargs["ordered"] is False
+        assert not db.collection.insert_one.called
+
+    @patch("app.flashcards.database.FlashcardDatabaseV2._connect")
+    def test_add_flashcards_bulk_partial_failure(self, mock_connect):
+        """Test that cards rejected by the bulk write come back as None."""
+        db = FlashcardDatabaseV2()
+        db.collection = Mock()
+
+        def insert_many(documents, ordered):
+            self._assign_ids(documents, ordered)
+            raise BulkWriteError(
+                {"writeErrors": [{"index": 1, "errmsg": "duplicate key"}]}
+            )
+
+        db.collection.insert_many.side_effect = insert_many
+
+        result_ids = db.add_flashcards_bulk(self._make_cards(3))
+
+        assert result_ids == ["id_0", None, "id_2"]
+
     def test_database_collections_exist(self):
         """Test that required database collections are accessible."""
         try:
@@ -163,3 +312,85 @@ class TestMongoDBConnection:
         assert call_kwargs["serverSelectionTimeoutMS"] == 5000
         assert call_kwargs["connectTimeoutMS"] == 5000
         assert call_kwargs["socketTimeoutMS"] == 5000
+
+
+class TestFlashcardStats:
+    """Test that the stats aggregations count like the per-stat queries they replace."""
+
+    @staticmethod
+    def _make_db():
+        now = datetime.now()
+        documents = [
+            {
+                "user_id": 1,
+                "type": "two_sided",
+                "due_date": now - timedelta(days=1),
+                "times_reviewed": 0,
+                "ease_factor": 2.5,
+                "interval_days": 30,
+            },
+            {
+                "user_id": 1,
+                "type": "fill_in_blank",
+                "due_date": now + timedelta(days=3),
+                "ease_factor": 2.5,
+                "interval_days": 1,
+            },
+            # Cards without a due date were never counted as due
+            {"user_id": 1, "type": "multiple_choice", "due_date": None},
+            {"user_id": 1, "type": "two_sided", "times_reviewed": 2},
+            {"user_id": 1, "type": "two_sided", "due_date": now + timedelta(days=30)},
+            {"user_id": 2, "type": "two_sided", "due_date": now - timedelta(days=1)},
+        ]
+        with patch("app.flashcards.database.FlashcardDatabaseV2._connect"):
+            db = FlashcardDatabaseV2()
+        db.collection = FakeStatsCollection(documents)
+        return db, now
+
+    def test_stats_bundle_matches_count_queries(self):
+        """Test that the stats bundle counts what the separate queries counted."""
+        db, now = self._make_db()
+        count = db.collection.count_documents
+
+        stats = db.get_stats_bundle(1)
+
+        assert stats == {
+            "total": count({"user_id": 1}),
+            "two_sided": count({"user_id": 1, "type": "two_sided"}),
+            "fill_in_blank": count({"user_id": 1, "type": "fill_in_blank"}),
+            "multiple_choice": count({"user_id": 1, "type": "multiple_choice"}),
+            "due_for_review": count({"user_id": 1, "due_date": {"$lte": now}}),
+        }
+        assert stats["due_for_review"] == 1
+
+    def test_dashboard_stats_match_count_queries(self):
+        """Test that dashboard stats count what the separate queries counted."""
+        db, now = self._make_db()
+        count = db.collection.count_documents
+        today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+        stats = db.get_dashboard_stats(1)
+
+        assert stats == {
+            "total": count({"user_id": 1}),
+            "due_today": count({"user_id": 1, "due_date": {"$lte": today_end}}),
+            "due_this_week": count(
+                {"user_id": 1, "due_date": {"$lte": now + timedelta(days=7)}}
+            ),
+            "new": count({"user_id": 1, "times_reviewed": 0}),
+            "mastered": count(
+                {
+                    "user_id": 1,
+                    "ease_factor": {"$gte": 2.5},
+                    "interval_days": {"$gte": 30},
+                }
+            ),
+        }
+        assert (stats["due_today"], stats["due_this_week"]) == (1, 2)
+
+    def test_stats_for_user_without_cards(self):
+        """Test that a user with no cards gets zero counts."""
+        db, _ = self._make_db()
+
+        assert db.get_stats_bundle(3)["total"] == 0
+        assert db.get_dashboard_stats(3)["due_today"] == 0
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from telegram import Update, User, Message, Chat
 from telegram.ext import ContextTypes
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from app.my_telegram.bot import init_application, handle_callback_query
 from app.my_telegram.handlers.command_handlers import (
     start,
@@ -176,6 +177,28 @@ class TestTelegramBot:
             else:
                 raise
 
+    def test_chatbot_model_switch_keeps_graph(self):
+        """Test that changing only the model reuses the user's chatbot and graph."""
+        from app.my_telegram.handlers.chatbot_handlers import get_user_chatbot, clear_user_chatbot
+        from app.my_telegram.session.config_manager import config_manager
+
+        user_id = 54321
+        config_manager.update_setting(user_id, "openai_api_key", "sk-test1234567890abcdefgh")
+        config_manager.update_setting(user_id, "model", "gpt-4o")
+        clear_user_chatbot(user_id)
+
+        chatbot = get_user_chatbot(user_id)
+        graph = chatbot.graph
+
+        config_manager.update_setting(user_id, "model", "gpt-4o-mini")
+        switched = get_user_chatbot(user_id)
+
+        assert switched is chatbot
+        assert switched.graph is graph
+        assert switched.default_model == "gpt-4o-mini"
+        assert switched.llm.model_name == "gpt-4o-mini"
+        clear_user_chatbot(user_id)
+
     @pytest.mark.asyncio
     async def test_message_handling_with_mocked_session(self):
         """Test message handling with mocked session manager."""
@@ -212,6 +235,258 @@ class TestTelegramBot:
                 # Verify a reply was sent
                 update.message.reply_text.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_chatbot_conversation_awaits_async_chat(self):
+        """Test that the handler awaits the chatbot's async chat."""
+        update = Mock(spec=Update)
+        update.effective_user = Mock(spec=User)
+        update.effective_user.id = 123456
+        update.message = Mock(spec=Message)
+        update.message.text = "Привет"
+        update.message.reply_text = AsyncMock()
+        update.message.chat = Mock()
+        update.message.chat.send_action = AsyncMock()
+
+        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
+
+        mock_tutor = Mock()
+        mock_tutor.chat_async = AsyncMock(
+            return_value={"success": True, "response": "Здравствуйте!", "messages": []}
+        )
+
+        with patch(
+            "app.my_telegram.handlers.chatbot_handlers.get_user_chatbot",
+            return_value=mock_tutor,
+        ):
+            from app.my_telegram.handlers.chatbot_handlers import (
+                process_chatbot_conversation,
+            )
+
+            await process_chatbot_conversation(update, context)
+
+        mock_tutor.chat_async.assert_awaited_once()
+        assert mock_tutor.chat_async.call_args.args[0] == "Привет"
+        assert not mock_tutor.chat.called
+        update.message.reply_text.assert_called_once_with(
+            "Здравствуйте!", parse_mode="Markdown"
+        )
+
+    @pytest.mark.asyncio
+    async def test_chatbot_conversation_replaces_history(self):
+        """Test that each turn stores the returned history instead of appending to it."""
+        update = Mock(spec=Update)
+        update.effective_user = Mock(spec=User)
+        update.effective_user.id = 654321
+        update.message = Mock(spec=Message)
+        update.message.reply_text = AsyncMock()
+        update.message.chat = Mock()
+        update.message.chat.send_action = AsyncMock()
+        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
+
+        async def chat_async(
+            user_text, conversation_history, user_id, on_token, on_reply_start
+        ):
+            messages = [SystemMessage(content="system")] + conversation_history
+            messages += [HumanMessage(content=user_text), AIMessage(content="Да")]
+            return {"success": True, "response": "Да", "messages": messages}
+
+        mock_tutor = Mock()
+        mock_tutor.chat_async = chat_async
+        session = session_manager.get_session(654321)
+        session.clear_conversation_history()
+
+        with patch(
+            "app.my_telegram.handlers.chatbot_handlers.get_user_chatbot",
+            return_value=mock_tutor,
+        ):
+            from app.my_telegram.handlers.chatbot_handlers import (
+                process_chatbot_conversation,
+            )
+
+            for text in ("Раз", "Два"):
+                update.message.text = text
+                await process_chatbot_conversation(update, context)
+
+        assert [m.content for m in session.get_conversation_history()] == [
+            "Раз",
+            "Да",
+            "Два",
+            "Да",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_streaming_reply_edits_draft(self):
+        """Test that a streamed reply is drafted once and then finalized in place."""
+        from app.common.telegram_utils import StreamingReply
+
+        draft = Mock(spec=Message)
+        draft.edit_text = AsyncMock()
+        message = Mock(spec=Message)
+        message.reply_text = AsyncMock(return_value=draft)
+
+        reply = StreamingReply(message, edit_interval=60)
+        for token in ["При", "вет", "!"]:
+            await reply.add(token)
+        await reply.finish("*Привет!*")
+
+        # Only the first token is shown before the edit interval throttles updates
+        message.reply_text.assert_called_once_with("При")
+        draft.edit_text.assert_called_once_with(
+            "*Привет!*", parse_mode="Markdown", reply_markup=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_streaming_reply_sends_final_text_when_draft_edit_fails(self):
+        """Test that the full reply is sent anew when the draft can't be edited."""
+        from app.common.telegram_utils import StreamingReply
+
+        draft = Mock(spec=Message)
+        draft.edit_text = AsyncMock(side_effect=Exception("Flood control exceeded"))
+        message = Mock(spec=Message)
+        message.reply_text = AsyncMock(return_value=draft)
+
+        reply = StreamingReply(message, edit_interval=60)
+        await reply.add("При")
+        await reply.finish("*Привет!*")
+
+        # Markdown and plain-text edits were both tried before falling back
+        assert draft.edit_text.call_count == 2
+        assert message.reply_text.call_args_list[-1].args == ("*Привет!*",)
+        assert message.reply_text.call_args_list[-1].kwargs == {
+            "parse_mode": "Markdown"
+        }
+
+    @pytest.mark.asyncio
+    async def test_streaming_reply_reset_starts_a_new_draft_text(self):
+        """Test that tokens of an earlier reply are dropped from the draft on reset."""
+        from app.common.telegram_utils import StreamingReply
+
+        draft = Mock(spec=Message)
+        draft.edit_text = AsyncMock()
+        message = Mock(spec=Message)
+        message.reply_text = AsyncMock(return_value=draft)
+
+        reply = StreamingReply(message, edit_interval=0)
+        await reply.add("Сейчас посмотрю.")
+        await reply.reset()
+        await reply.add("Привет")
+
+        message.reply_text.assert_called_once_with("Сейчас посмотрю.")
+        draft.edit_text.assert_called_once_with("Привет")
+
+    @pytest.mark.asyncio
+    async def test_chatbot_failure_replaces_streamed_draft(self):
+        """Test that a failed turn replaces the partial draft with the error."""
+        update = Mock(spec=Update)
+        update.effective_user = Mock(spec=User)
+        update.effective_user.id = 777
+        update.message = Mock(spec=Message)
+        update.message.text = "Привет"
+        draft = Mock(spec=Message)
+        draft.edit_text = AsyncMock()
+        update.message.reply_text = AsyncMock(return_value=draft)
+        update.message.chat = Mock()
+        update.message.chat.send_action = AsyncMock()
+        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
+
+        async def chat_async(
+            user_text, conversation_history, user_id, on_token, on_reply_start
+        ):
+            await on_reply_start()
+            await on_token("Здравст")
+            return {"success": False, "error": "API error", "messages": []}
+
+        mock_tutor = Mock()
+        mock_tutor.chat_async = chat_async
+
+        with patch(
+            "app.my_telegram.handlers.chatbot_handlers.get_user_chatbot",
+            return_value=mock_tutor,
+        ):
+            from app.my_telegram.handlers.chatbot_handlers import (
+                process_chatbot_conversation,
+            )
+
+            await process_chatbot_conversation(update, context)
+
+        update.message.reply_text.assert_called_once_with("Здравст")
+        draft.edit_text.assert_called_once()
+        assert "encountered an error" in draft.edit_text.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_update_processor_runs_users_concurrently(self):
+        """Test that updates of different users overlap and one user's run in order."""
+        import asyncio
+        from app.my_telegram.update_processor import PerUserUpdateProcessor
+
+        processor = PerUserUpdateProcessor(8)
+        events = []
+
+        def make_update(user_id):
+            update = Mock(spec=Update)
+            update.effective_user = Mock(spec=User)
+            update.effective_user.id = user_id
+            return update
+
+        async def handle(name):
+            events.append(f"start {name}")
+            await asyncio.sleep(0.01)
+            events.append(f"end {name}")
+
+        await asyncio.gather(
+            processor.process_update(make_update(1), handle("a1")),
+            processor.process_update(make_update(1), handle("a2")),
+            processor.process_update(make_update(2), handle("b1")),
+        )
+
+        # User 2 starts while user 1's first update is still running
+        assert events.index("start b1") < events.index("end a1")
+        # User 1's second update waits for the first to finish
+        assert events.index("end a1") < events.index("start a2")
+        assert processor._user_queues == {}
+
+    @pytest.mark.asyncio
+    async def test_update_processor_burst_does_not_delay_other_users(self):
+        """Test that one user's queued updates don't hold slots other users need."""
+        import asyncio
+        from app.my_telegram.update_processor import PerUserUpdateProcessor
+
+        processor = PerUserUpdateProcessor(2)
+        events = []
+
+        def make_update(user_id):
+            update = Mock(spec=Update)
+            update.effective_user = Mock(spec=User)
+            update.effective_user.id = user_id
+            return update
+
+        async def handle(name, seconds):
+            events.append(f"start {name}")
+            await asyncio.sleep(seconds)
+            events.append(f"end {name}")
+
+        burst = [
+            asyncio.create_task(
+                processor.process_update(make_update(1), handle(f"a{i}", 0.05))
+            )
+            for i in range(1, 4)
+        ]
+        await asyncio.sleep(0)
+        await processor.process_update(make_update(2), handle("b1", 0.01))
+
+        # User 2 is done while user 1's first update is still running
+        assert "end b1" in events
+        assert "end a1" not in events
+        await asyncio.gather(*burst)
+        assert [e for e in events if e.split()[1].startswith("a")] == [
+            "start a1",
+            "end a1",
+            "start a2",
+            "end a2",
+            "start a3",
+            "end a3",
+        ]
+
     def test_bot_configuration(self):
         """Test that bot is configured with correct settings."""
         # Test that init_application returns a properly configured app